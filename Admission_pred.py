@@ -1,23 +1,61 @@
-import pickle
+import io
 import streamlit as st
 import numpy as np
-import statsmodels.api as sm  # Import statsmodels for OLS
+import admission_artifact
+from admission_engine import AdmissionEngine
+from admission_schema import AdmissionSchema
+import model_registry
+from drift_monitor import get_monitor
+from prediction_cache import PredictionCache
+from tracing import debug_sidebar, get_tracer
 
 # Set Page Configuration
 st.set_page_config(page_title="Admission Predictor", page_icon="🎓", layout="centered")
 
+# Per-stage timings, recorded only when APP_TRACING=1
+tracer = get_tracer('admission')
 
-# Load model and scaler only once using caching
+
+# Report missing or stale artifacts once per process, before rendering anything
 @st.cache_resource
-def load_model():
-    with open('ols_model.pkl', 'rb') as f:
-        model = pickle.load(f)
-    with open('scaler.pkl', 'rb') as f:
-        scaler = pickle.load(f)
-    return model, scaler
+def artifact_problems():
+    return admission_artifact.check()
+
+
+for name, filename, problem in artifact_problems():
+    st.warning(f"⚠️ Model artifact `{filename}`: {problem}")
 
+# Slim OLS export (parameters, scaler statistics, covariance); the statsmodels pickle is never opened
+try:
+    with tracer.span('artifact_load'):
+        artifact = admission_artifact.load()
+except model_registry.ArtifactError as e:
+    st.error(f"⚠️ {e}")
+    st.stop()
+model_version = artifact['model_version']
 
-sm_model, scaler = load_model()
+
+# Fold the scaler into the OLS weights once per artifact version so predictions are a single dot product
+@st.cache_resource
+def load_engine(version):
+    with tracer.span('engine_build'):
+        return AdmissionEngine.from_artifact(admission_artifact.load())
+
+
+engine = load_engine(model_version)
+schema = AdmissionSchema(engine.feature_names)
+
+
+# Process-wide LRU of recent predictions; cleared when the model artifact changes
+@st.cache_resource
+def load_prediction_cache():
+    return PredictionCache(maxsize=4096)
+
+
+prediction_cache = load_prediction_cache()
+
+# Constant-memory histograms of submitted applicants, compared with the training data in drift_admin.py
+drift = get_monitor('admission')
 
 # Sidebar with Banner and Problem Statement
 st.sidebar.image("https://img.studydekho.com/uploads/c/2017/12/c-jamboree-education-pvt-ltd-jaipur-3512.jpg", width=300)
@@ -36,6 +74,8 @@ st.sidebar.markdown(
     - SOP Strength
     - LOR Strength
     - Undergraduate GPA
+    - University Rating
+    - Research Experience
 
     **Model Used:** Linear Regression (OLS)
 
@@ -65,23 +105,39 @@ TOEFL = col2.number_input("📚 TOEFL Score (out of 120)", 1, 120, help="Enter y
 SOP = col1.number_input("✍️ SOP Strength (1.0 - 5.0)", 1.0, 5.0, 3.0, step=0.1, help="Rate your SOP.")
 LOR = col2.number_input("🔗 LOR Strength (1.0 - 5.0)", 1.0, 5.0, 3.0, step=0.1, help="Rate your LOR.")
 GPA = col1.number_input("📐 Undergraduate GPA (out of 10)", 1.0, 10.0, 7.0, step=0.1, help="Enter your GPA.")
+rating = col2.selectbox("🏛️ University Rating (1 - 5)", [1, 2, 3, 4, 5], index=3, help="Rating of your undergraduate university.")
+research = col1.radio("🔬 Research Experience", ["Yes", "No"], horizontal=True, help="Do you have research experience?")
 
+# Applicant keyed by the dataset's column names; the schema maps them to model positions
+applicant = {
+    'GRE Score': GRE, 'TOEFL Score': TOEFL, 'University Rating': rating, 'SOP': SOP,
+    'LOR': LOR, 'CGPA': GPA, 'Research': 1 if research == "Yes" else 0,
+}
 
-# Prediction Function
-def predict_admission(GRE, TOEFL, SOP, LOR, GPA):
-    input_data = np.array([GRE, TOEFL, 4, SOP, LOR, GPA, 1]).reshape(1, -1)
-    input_data_scaled = scaler.transform(input_data)
-    X_input_sm = sm.add_constant(input_data_scaled, has_constant='add')
-    prediction = sm_model.predict(X_input_sm) * 100
-    return prediction[0]
+
+# Prediction Function (same vectorised path as bulk scoring, with one row): chance and its 95% interval
+def predict_admission(applicant):
+    with tracer.span('preprocess'):
+        features = schema.row(applicant)
+    with tracer.span('predict'):
+        chance = float(engine.predict(features)[0])
+    with tracer.span('interval'):
+        low, high = engine.interval(features)
+    return chance, float(low[0]), float(high[0])
 
 
 # Prediction Button
 if st.button("🔮 Predict Admission Chance"):
     with st.spinner("🔍 Analyzing your profile..."):
-        prediction = predict_admission(GRE, TOEFL, SOP, LOR, GPA)
+        features = schema.row(applicant)[0]
+        prediction, low, high = prediction_cache.get_or_compute(
+            model_version, features, lambda: predict_admission(applicant))
+        if drift is not None:
+            with tracer.span('drift_observe'):
+                drift.observe(features)
 
     st.success(f"🎯 Your predicted admission chance is **{prediction:.2f}%**!")
+    st.caption(f"95% confidence interval for the expected chance of applicants like you: {low:.2f}% – {high:.2f}%")
 
     # Display additional insights
     if prediction > 80:
@@ -92,6 +148,109 @@ if st.button("🔮 Predict Admission Chance"):
     else:
         st.write("📉 **Low probability.** Consider enhancing your profile!")
 
+# What-if Section
+st.markdown("---")
+st.subheader("🧪 What-if Explorer")
+st.markdown("See how your chance changes across two factors at once, with everything else fixed at your inputs.")
+
+# Axis ranges for the what-if grid: model feature -> (label, low, high)
+WHAT_IF_AXES = {
+    'GRE Score': ("GRE Score", 290, 340),
+    'TOEFL Score': ("TOEFL Score", 92, 120),
+    'SOP': ("SOP Strength", 1.0, 5.0),
+    'LOR ': ("LOR Strength", 1.0, 5.0),
+    'CGPA': ("Undergraduate GPA", 6.0, 10.0),
+}
+
+
+# Whole grid in one vectorised pass, memoised per model version, inputs and axes
+@st.cache_data(max_entries=64)
+def what_if_grid(model_version, base, x_name, y_name, resolution):
+    x_values = np.linspace(*WHAT_IF_AXES[x_name][1:], resolution)
+    y_values = np.linspace(*WHAT_IF_AXES[y_name][1:], resolution)
+    with tracer.span('what_if_grid'):
+        grid = engine.predict_grid(
+            base, engine.feature_names.index(x_name), x_values, engine.feature_names.index(y_name), y_values
+        )
+    return x_values, y_values, grid
+
+
+# Rendering the figure costs far more than the grid, so the PNG is memoised too and plain reruns reuse it
+@st.cache_data(max_entries=64)
+def what_if_heatmap(model_version, base, x_name, y_name, resolution):
+    # matplotlib is only imported once someone opens the explorer
+    import matplotlib.pyplot as plt
+
+    x_values, y_values, grid = what_if_grid(model_version, base, x_name, y_name, resolution)
+    with tracer.span('heatmap_render'):
+        fig, ax = plt.subplots(figsize=(7, 5))
+        image = ax.imshow(
+            grid, origin='lower', aspect='auto', cmap='RdYlGn',
+            extent=(x_values[0], x_values[-1], y_values[0], y_values[-1]),
+        )
+        ax.plot(base[engine.feature_names.index(x_name)], base[engine.feature_names.index(y_name)], 'k*', markersize=14, label="You")
+        # Keep the grid's extent even when your inputs fall outside it
+        ax.set_xlim(x_values[0], x_values[-1])
+        ax.set_ylim(y_values[0], y_values[-1])
+        ax.set_xlabel(WHAT_IF_AXES[x_name][0])
+        ax.set_ylabel(WHAT_IF_AXES[y_name][0])
+        ax.legend(loc='upper left')
+        fig.colorbar(image, ax=ax, label="Predicted chance (%)")
+        png = io.BytesIO()
+        fig.savefig(png, format='png', bbox_inches='tight')
+        plt.close(fig)
+    return png.getvalue()
+
+
+if st.toggle("Show the what-if explorer"):
+    axis_names = list(WHAT_IF_AXES)
+    wcol1, wcol2, wcol3 = st.columns(3)
+    x_name = wcol1.selectbox("↔️ Horizontal axis", axis_names, index=axis_names.index('GRE Score'), format_func=lambda n: WHAT_IF_AXES[n][0])
+    y_name = wcol2.selectbox("↕️ Vertical axis", [n for n in axis_names if n != x_name], format_func=lambda n: WHAT_IF_AXES[n][0])
+    resolution = wcol3.select_slider("🔬 Grid points per axis", [25, 50, 100, 200, 316], value=100)
+
+    base = tuple(schema.row(applicant)[0])
+    st.image(what_if_heatmap(model_version, base, x_name, y_name, resolution))
+
+# Prediction cache stats across all sessions served by this process
+cache_stats = prediction_cache.stats()
+st.sidebar.markdown("## ⚡ Prediction Cache")
+if cache_stats['hit_rate'] is not None:
+    st.sidebar.write(f"**Hit rate:** {cache_stats['hit_rate']:.1%} ({cache_stats['hits']} hits / {cache_stats['misses']} misses)")
+st.sidebar.write(f"**Entries:** {cache_stats['size']} / {cache_stats['maxsize']} | **Evictions:** {cache_stats['evictions']} | **Model changes:** {cache_stats['invalidations']}")
+
+# Batch Scoring Section
+st.markdown("---")
+st.subheader("📂 Score a Whole Cohort")
+st.markdown("Upload a CSV shaped like `Jamboree_Admission.csv` to score every applicant at once.")
+
+uploaded_file = st.file_uploader("Upload applicants CSV", type="csv")
+if uploaded_file is not None:
+    # pandas comes in with the batch scorer, only once a file is uploaded
+    from admission_batch import iter_scored_chunks, score_csv
+
+    try:
+        with tracer.span('batch_preview'):
+            preview = next(iter_scored_chunks(uploaded_file, engine, chunk_size=20))
+    except (ValueError, StopIteration) as e:
+        st.error(f"⚠️ Could not score this file: {e}")
+    else:
+        st.dataframe(preview)
+
+        # The file is scored only when the download is requested, chunk by chunk as Streamlit reads the stream
+        def build_scored_csv():
+            uploaded_file.seek(0)
+            return score_csv(uploaded_file, engine)
+
+        st.download_button(
+            "⬇️ Download Scored CSV",
+            data=build_scored_csv,
+            file_name=f"scored_{uploaded_file.name}",
+            mime="text/csv",
+        )
+
+debug_sidebar(tracer)
+
 # Footer
 st.markdown("---")
 st.markdown("""
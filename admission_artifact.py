@@ -0,0 +1,139 @@
+"""Slim export of the admission OLS model.
+
+ols_model.pkl is a full statsmodels RegressionResults, training design matrix
+and residuals included, and unpickling it imports statsmodels. Inference only
+needs the fitted parameters, so they are exported once into a small versioned
+JSON file:
+
+    params, param_names   OLS coefficients, const first
+    feature_names         scaler.feature_names_in_ (model column order)
+    scaler_mean/scale     StandardScaler statistics
+    cov_params, df_resid  for confidence intervals of the predicted chance
+
+JSON floats round-trip exactly, so an engine built from the export predicts
+exactly what one built from the pickles does. When the pickles are present
+and have changed since the export, load() re-exports; deployments may ship
+the JSON alone.
+
+    python admission_artifact.py                  # export next to the pickles
+    python admission_artifact.py --output admission_ols.json
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+
+import numpy as np
+
+import model_registry
+
+NAME = 'admission'
+ARTIFACT_PATH = os.path.join(model_registry.ARTIFACT_DIR, 'admission_ols.json')
+FORMAT_VERSION = 1
+
+_lock = threading.Lock()
+_loaded = {}
+
+
+def _signature(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _source_paths():
+    return [os.path.join(model_registry.ARTIFACT_DIR, f) for f in model_registry.ARTIFACTS[NAME].values()]
+
+
+def build():
+    """Slim artifact contents from the registry's ols_model.pkl and scaler.pkl."""
+    bundle = model_registry.get(NAME)
+    results, scaler = bundle.model, bundle.scaler
+    return {
+        'format': FORMAT_VERSION,
+        'model': NAME,
+        'model_version': bundle.version,
+        'feature_names': [str(c) for c in scaler.feature_names_in_],
+        'param_names': list(results.model.exog_names),
+        'params': np.asarray(results.params, dtype=np.float64).tolist(),
+        'scaler_mean': np.asarray(scaler.mean_, dtype=np.float64).tolist(),
+        'scaler_scale': np.asarray(scaler.scale_, dtype=np.float64).tolist(),
+        'cov_type': results.cov_type,
+        'cov_params': np.asarray(results.cov_params(), dtype=np.float64).tolist(),
+        'df_resid': float(results.df_resid),
+    }
+
+
+def save(artifact, path=ARTIFACT_PATH):
+    staging = f"{path}.tmp"
+    with open(staging, 'w') as f:
+        json.dump(artifact, f, indent=2)
+        f.write('\n')
+    os.replace(staging, path)
+
+
+def _read(path):
+    with open(path) as f:
+        artifact = json.load(f)
+    if artifact.get('format') != FORMAT_VERSION:
+        raise model_registry.ArtifactError(f"{path}: unsupported admission artifact format {artifact.get('format')}")
+    return artifact
+
+
+def load(path=ARTIFACT_PATH):
+    """The slim artifact, read once per process and again when it or its source pickles change on disk."""
+    with _lock:
+        sources = [_signature(p) for p in _source_paths()]
+        key = (_signature(path), tuple(sources))
+        cached = _loaded.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        artifact = _read(path) if key[0] is not None else None
+        if None not in sources:
+            # Pickles present: re-export when they were retrained since the JSON was written
+            if artifact is None or artifact['model_version'] != model_registry.version(NAME):
+                artifact = build()
+                try:
+                    save(artifact, path)
+                except OSError:
+                    pass  # Read-only deployment: keep the in-memory export
+                key = (_signature(path), key[1])
+        elif artifact is None:
+            raise model_registry.ArtifactError(
+                f"Missing artifact for {NAME}: neither {path} nor the pickles to export it from are present")
+        _loaded[path] = (key, artifact)
+        return artifact
+
+
+def check(path=ARTIFACT_PATH):
+    """(name, filename, problem) for the admission artifacts, like model_registry.check_artifacts.
+
+    The pickles are checked against model_manifest.json only when present, so
+    a deployment that ships just the JSON export reports nothing.
+    """
+    if all(os.path.exists(p) for p in _source_paths()):
+        return model_registry.check_artifacts([NAME])
+    if not os.path.exists(path):
+        return [(NAME, os.path.basename(path), 'missing')]
+    return []
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', default=ARTIFACT_PATH, help='where to write the export')
+    args = parser.parse_args()
+
+    artifact = build()
+    save(artifact, args.output)
+    pickle_bytes = sum(os.path.getsize(p) for p in _source_paths())
+    print(f"Exported {len(artifact['params'])} OLS parameters for admission {artifact['model_version']} -> "
+          f"{args.output} ({os.path.getsize(args.output)} bytes, pickles {pickle_bytes} bytes)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
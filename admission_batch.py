@@ -0,0 +1,77 @@
+"""Vectorised batch scoring for the admission OLS model.
+
+Rows are read in chunks and scored through the folded AdmissionEngine
+kernel so whole cohorts never go through the per-row predict path.
+"""
+import io
+
+import pandas as pd
+
+from admission_schema import AdmissionSchema
+
+CHUNK_SIZE = 10_000
+PREDICTION_COLUMN = 'Predicted Chance (%)'
+
+
+def score_frame(frame, engine):
+    return engine.predict(AdmissionSchema(engine.feature_names).matrix(frame))
+
+
+def iter_scored_chunks(source, engine, chunk_size=CHUNK_SIZE):
+    for chunk in pd.read_csv(source, chunksize=chunk_size):
+        chunk[PREDICTION_COLUMN] = score_frame(chunk, engine)
+        yield chunk
+
+
+class ScoredCsv(io.RawIOBase):
+    """Read-only byte stream of the scored CSV; each chunk is scored when the reader reaches it.
+
+    Only the chunk being read is held here, so nothing grows with the upload
+    before the consumer takes the bytes. st.download_button accepts any
+    io.RawIOBase, reads it once, and keeps the finished file in Streamlit's
+    media store.
+    """
+
+    def __init__(self, source, engine, chunk_size=CHUNK_SIZE):
+        self._parts = (
+            chunk.to_csv(index=False, header=(i == 0)).encode('utf-8')
+            for i, chunk in enumerate(iter_scored_chunks(source, engine, chunk_size))
+        )
+        self._part = memoryview(b'')
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        # Streamlit rewinds before reading; only that no-op rewind is possible on a stream
+        if (offset, whence) in ((0, io.SEEK_SET), (0, io.SEEK_CUR)) and self._position == 0:
+            return 0
+        raise io.UnsupportedOperation("ScoredCsv can only be read once, from the start")
+
+    def readinto(self, buffer):
+        while not self._part:
+            part = next(self._parts, None)
+            if part is None:
+                return 0
+            self._part = memoryview(part)
+        n = min(len(buffer), len(self._part))
+        buffer[:n] = self._part[:n]
+        self._part = self._part[n:]
+        self._position += n
+        return n
+
+    def readall(self):
+        # One join over the remaining chunks instead of many small reads
+        data = b''.join([bytes(self._part), *self._parts])
+        self._part = memoryview(b'')
+        self._position += len(data)
+        return data
+
+
+def score_csv(source, engine, chunk_size=CHUNK_SIZE):
+    """The scored CSV as a stream that scores chunk by chunk while it is read."""
+    return ScoredCsv(source, engine, chunk_size)
@@ -0,0 +1,104 @@
+"""Precompiled linear scoring kernel for the admission OLS model.
+
+The StandardScaler statistics are folded into the OLS coefficients once at
+load time, so a prediction is a single dot product plus a bias:
+
+    chance = const + sum(p_i * (x_i - mean_i) / scale_i)
+           = (const - sum(p_i * mean_i / scale_i)) + sum((p_i / scale_i) * x_i)
+
+Weights and bias are stored in percentage points to match the app output.
+The same linear map folds the OLS covariance matrix, so confidence intervals
+for the predicted chance come from [1, x] @ covariance @ [1, x] without
+rescaling the inputs.
+"""
+import numpy as np
+
+
+class AdmissionEngine:
+    def __init__(self, weights, bias, feature_names, covariance=None, df_resid=None):
+        self.weights = np.ascontiguousarray(weights, dtype=np.float64)
+        self.bias = float(bias)
+        self.feature_names = list(feature_names)
+        # Covariance of [bias, weights] in percentage points squared; None when built without one
+        self.covariance = None if covariance is None else np.ascontiguousarray(covariance, dtype=np.float64)
+        self.df_resid = df_resid
+        self._t_values = {}
+
+    @classmethod
+    def from_params(cls, params, mean, scale, feature_names, cov_params=None, df_resid=None):
+        params = np.asarray(params, dtype=np.float64)
+        mean = np.asarray(mean, dtype=np.float64)
+        scale = np.asarray(scale, dtype=np.float64)
+        const, coefs = params[0], params[1:]
+        if coefs.shape[0] != len(mean):
+            raise ValueError(f"OLS model has {coefs.shape[0]} coefficients but scaler has {len(mean)} features")
+        weights = coefs / scale
+        bias = const - np.dot(weights, mean)
+        covariance = None
+        if cov_params is not None:
+            # [bias, weights] = fold @ params, so their covariance is fold @ cov_params @ fold.T
+            fold = np.zeros((len(params), len(params)))
+            fold[0, 0] = 1.0
+            fold[0, 1:] = -mean / scale
+            fold[1:, 1:] = np.diag(1.0 / scale)
+            covariance = fold @ np.asarray(cov_params, dtype=np.float64) @ fold.T * 100 ** 2
+        return cls(weights * 100, bias * 100, feature_names, covariance, df_resid)
+
+    @classmethod
+    def from_artifacts(cls, sm_model, scaler):
+        return cls.from_params(
+            sm_model.params, scaler.mean_, scaler.scale_, scaler.feature_names_in_,
+            np.asarray(sm_model.cov_params()), sm_model.df_resid,
+        )
+
+    @classmethod
+    def from_artifact(cls, artifact):
+        # Slim export from admission_artifact: no pickles, no statsmodels
+        return cls.from_params(
+            artifact['params'], artifact['scaler_mean'], artifact['scaler_scale'], artifact['feature_names'],
+            artifact['cov_params'], artifact['df_resid'],
+        )
+
+    @classmethod
+    def from_bundle(cls, bundle):
+        # Uses the registry's memory-mapped arrays, so the pickles stay unopened once cached
+        arrays = bundle.arrays
+        return cls.from_params(arrays['params'], arrays['scaler_mean'], arrays['scaler_scale'], bundle.feature_names)
+
+    def predict(self, features):
+        # features: (n_rows, n_features) array in feature_names order
+        return np.asarray(features, dtype=np.float64) @ self.weights + self.bias
+
+    def predict_one(self, values):
+        return float(np.dot(self.weights, values)) + self.bias
+
+    def interval(self, features, confidence=0.95):
+        """(low, high) confidence bounds on the mean predicted chance for each row.
+
+        Matches statsmodels' get_prediction(...).conf_int(alpha=1 - confidence).
+        """
+        if self.covariance is None:
+            raise ValueError("This engine was built without a covariance matrix")
+        if confidence not in self._t_values:
+            from scipy import stats
+
+            self._t_values[confidence] = float(stats.t.ppf(0.5 + confidence / 2, self.df_resid))
+        features = np.asarray(features, dtype=np.float64)
+        design = np.column_stack([np.ones(len(features)), features])
+        se = np.sqrt(np.einsum('ij,jk,ik->i', design, self.covariance, design))
+        chance = features @ self.weights + self.bias
+        margin = self._t_values[confidence] * se
+        return chance - margin, chance + margin
+
+    def predict_grid(self, base, x_index, x_values, y_index, y_values):
+        """Chance over every (y, x) combination of two features, other features fixed at base.
+
+        The model is linear, so the grid is the base prediction with the two
+        features' contributions swapped out: one broadcast add instead of a
+        (len(y_values) * len(x_values), n_features) matrix product.
+        """
+        base = np.asarray(base, dtype=np.float64)
+        x_values = np.asarray(x_values, dtype=np.float64)
+        y_values = np.asarray(y_values, dtype=np.float64)
+        rest = self.predict_one(base) - self.weights[x_index] * base[x_index] - self.weights[y_index] * base[y_index]
+        return (rest + self.weights[y_index] * y_values)[:, None] + self.weights[x_index] * x_values[None, :]
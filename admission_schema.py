@@ -0,0 +1,41 @@
+"""Column layout for admission data, shared by single-row and bulk scoring.
+
+Jamboree_Admission.csv names two columns with a trailing space ('LOR ' and
+'Chance of Admit '), and the model was fitted on those exact names. The
+schema matches columns on their stripped names, so 'LOR' and 'LOR ' both
+resolve to the model's LOR position, and builds the (n_rows, n_features)
+matrix the engine scores. A single applicant becomes a one-row matrix through the
+same column resolution and the same engine.predict call.
+"""
+import numpy as np
+
+ID_COLUMN = 'Serial No.'
+TARGET_COLUMN = 'Chance of Admit '
+
+
+class AdmissionSchema:
+    def __init__(self, feature_names):
+        self.feature_names = list(feature_names)
+        # Stripped column name -> position in the model's feature vector
+        self.positions = {name.strip(): i for i, name in enumerate(self.feature_names)}
+
+    def resolve(self, columns):
+        """Map each model position to a column in columns, or raise ValueError listing the missing ones."""
+        by_stripped = {str(c).strip(): c for c in columns}
+        missing = [name for name in self.feature_names if name.strip() not in by_stripped]
+        if missing:
+            raise ValueError(f"Missing required columns: {', '.join(repr(c) for c in missing)}")
+        return [by_stripped[name.strip()] for name in self.feature_names]
+
+    def matrix(self, frame):
+        return frame[self.resolve(frame.columns)].to_numpy(dtype=np.float64)
+
+    def row(self, record):
+        """One-row feature matrix for an applicant given as {column name: value}."""
+        return np.array([[record[c] for c in self.resolve(record)]], dtype=np.float64)
+
+    def target(self, frame):
+        """Observed chance of admit in percent, if the frame has it."""
+        by_stripped = {str(c).strip(): c for c in frame.columns}
+        column = by_stripped.get(TARGET_COLUMN.strip())
+        return None if column is None else frame[column].to_numpy(dtype=np.float64) * 100
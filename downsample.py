@@ -0,0 +1,83 @@
+"""Server-side downsampling so chart payloads stay bounded.
+
+A chart cannot show more points than it has pixels, so long histories are
+reduced before they are sent to the browser:
+
+* lttb_indices keeps the visually significant points of one series
+  (Largest-Triangle-Three-Buckets).
+* minmax_indices keeps the extreme rows of every bucket for every column,
+  which preserves spikes in multi-series charts that share one index.
+"""
+import numpy as np
+import pandas as pd
+
+
+def lttb_indices(y, n_out, x=None):
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.arange(n, dtype=np.float64) if x is None else np.asarray(x, dtype=np.float64)
+
+    # The first and last points are always kept; the rest is split into n_out - 2 buckets
+    edges = (np.arange(n_out - 1) * (n - 2) / (n_out - 2)).astype(np.int64) + 1
+    edges[-1] = n - 1
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_hi = edges[i + 2] if i + 2 < len(edges) else n
+        next_lo = hi if i + 2 < len(edges) else n - 1
+        avg_x = x[next_lo:next_hi].mean()
+        avg_y = y[next_lo:next_hi].mean()
+        # Keep the point forming the largest triangle with the last kept point and the next bucket's average
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def minmax_indices(values, n_buckets):
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 1:
+        values = values[:, None]
+    n = len(values)
+    if n <= 2 * n_buckets:
+        return np.arange(n)
+
+    bucket = np.arange(n) * n_buckets // n
+    keep = {0, n - 1}
+    for column in values.T:
+        high = pd.Series(np.where(np.isnan(column), -np.inf, column)).groupby(bucket).idxmax()
+        low = pd.Series(np.where(np.isnan(column), np.inf, column)).groupby(bucket).idxmin()
+        keep.update(high.to_numpy().tolist())
+        keep.update(low.to_numpy().tolist())
+    return np.array(sorted(keep))
+
+
+def downsample(data, max_points):
+    """Return at most ~max_points rows of a Series or DataFrame, chosen for display."""
+    if len(data) <= max_points:
+        return data
+    if isinstance(data, pd.Series) or data.shape[1] == 1:
+        series = data if isinstance(data, pd.Series) else data.iloc[:, 0]
+        series = series.dropna()
+        x = series.index.asi8 if isinstance(series.index, pd.DatetimeIndex) else None
+        idx = lttb_indices(series.to_numpy(), max_points, x)
+        return data.loc[series.index[idx]]
+    # Each bucket contributes up to two rows per column
+    n_buckets = max(1, max_points // (2 * data.shape[1]))
+    return data.iloc[minmax_indices(data.to_numpy(), n_buckets)]
+
+
+def page_count(frame, page_size):
+    return max(1, -(-len(frame) // page_size))
+
+
+def page(frame, page_number, page_size):
+    """Rows of one table page (1-based), so the table payload is bounded by page_size."""
+    page_number = min(max(1, page_number), page_count(frame, page_size))
+    start = (page_number - 1) * page_size
+    return frame.iloc[start:start + page_size]
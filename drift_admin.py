@@ -0,0 +1,68 @@
+import streamlit as st
+import pandas as pd
+from drift_monitor import REFERENCES, bin_labels, compare, histograms, reset
+from tracing import debug_sidebar, get_tracer
+
+# Set Page Configuration
+st.set_page_config(page_title="Input Drift Monitor", page_icon="📡", layout="wide")
+
+# Per-stage timings, recorded only when APP_TRACING=1
+tracer = get_tracer('drift_admin')
+
+STATUS_LABELS = {'stable': '🟢 stable', 'watch': '🟡 watch', 'drift': '🔴 drift', 'no data': '⚪ no data'}
+
+st.title("📡 Input Drift Monitor")
+st.markdown(
+    "Live inputs to the prediction apps, counted into fixed histograms over the training deciles and "
+    "compared with the training data. **PSI** ≥ 0.1 is worth watching and ≥ 0.25 is drift; "
+    "**KS** above its critical value is a significant difference at the 5% level."
+)
+
+# Sidebar: app selection and controls
+app = st.sidebar.selectbox("App", list(REFERENCES), format_func=lambda name: f"{name} ({REFERENCES[name]['dataset']})")
+st.sidebar.button("🔄 Refresh")
+
+try:
+    with tracer.span('load_histograms'):
+        references, live = histograms(app)
+except FileNotFoundError as e:
+    st.error(f"⚠️ {e}")
+    st.stop()
+
+with tracer.span('compare'):
+    report = compare(references, live)
+
+live_rows = max(entry['live_rows'] for entry in report)
+col1, col2, col3 = st.columns(3)
+col1.metric("Live requests", f"{live_rows:,}")
+col2.metric("Training rows", f"{report[0]['reference_rows']:,}")
+col3.metric("Drifting features", sum(entry['status'] == 'drift' for entry in report))
+
+# Per-feature summary
+summary = pd.DataFrame(report)
+summary['status'] = summary['status'].map(STATUS_LABELS)
+st.dataframe(
+    summary[['feature', 'status', 'psi', 'ks', 'ks_critical', 'live_rows']].round(4),
+    hide_index=True,
+)
+
+# Reference vs live distribution for one feature
+st.subheader("🔍 Feature Distribution")
+feature = st.selectbox("Feature", list(references))
+distribution = pd.DataFrame(
+    {'Training': references[feature].proportions(), 'Live': live[feature].proportions()},
+    index=pd.Index(bin_labels(references[feature]), name="Bin"),
+)
+if live[feature].total:
+    st.bar_chart(distribution, stack=False)
+else:
+    st.info("No live requests have been counted for this app yet.")
+
+# Reset the live counts, e.g. after retraining or a deliberate change in traffic
+with st.sidebar.expander("Reset live counts"):
+    confirm = st.checkbox(f"Forget every live request counted for {app}")
+    if st.button("🗑️ Reset", disabled=not confirm):
+        reset(app)
+        st.rerun()
+
+debug_sidebar(tracer)
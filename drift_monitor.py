@@ -0,0 +1,469 @@
+"""Streaming input-drift monitor for the admission and OLA apps.
+
+Every feature of a scored request is counted into a fixed-bin histogram
+whose cut points are the training distribution's deciles. Memory stays
+constant however many requests arrive, and the raw requests are never kept.
+The reference histograms are built once from the training CSVs
+(Jamboree_Admission.csv, ola__model_ready.csv) with the csv module, so the
+apps never import pandas for them, and cached as a small JSON sidecar. The
+CSV is re-read only when it changes.
+
+Each process writes its live counts to its own JSON file in DRIFT_DIR
+every FLUSH_EVERY requests or FLUSH_SECONDS, whichever comes first. The
+admin view (drift_admin.py) merges these files per app and compares them
+with the reference. When merging, the files of processes on this host that
+have exited are folded into one <app>-live-exited.json and deleted. The
+comparison uses:
+
+- PSI (population stability index) over the bins;
+- the two-sample Kolmogorov-Smirnov statistic over the binned CDFs, a lower
+  bound on the exact statistic. It is checked against the 5% critical value
+  for the two sample sizes.
+
+    python drift_monitor.py            # build references, print the report
+    python drift_monitor.py --reset    # forget the live counts
+"""
+import argparse
+import atexit
+import bisect
+import csv
+import glob
+import hashlib
+import json
+import logging
+import math
+import os
+import socket
+import sys
+import threading
+import time
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DRIFT_DIR = os.environ.get('DRIFT_MONITOR_DIR', '.drift_monitor')
+ENABLED = os.environ.get('DRIFT_MONITOR', '1').lower() in ('1', 'true', 'yes', 'on')
+
+# Training data and features per app, in the order the app's model consumes them
+REFERENCES = {
+    'admission': {
+        'dataset': 'Jamboree_Admission.csv',
+        'features': ['GRE Score', 'TOEFL Score', 'University Rating', 'SOP', 'LOR', 'CGPA', 'Research'],
+    },
+    'ola': {
+        'dataset': 'ola__model_ready.csv',
+        'features': [
+            'Age', 'Gender', 'Education_Level', 'Income', 'Joining Designation', 'Quarterly Rating',
+            'tenure_Months', 'Total Business Value', 'Quarterly_Rating_Increase', 'Income_Increase', 'City_Encoded',
+        ],
+    },
+}
+FORMAT_VERSION = 1
+BINS = 10
+FLUSH_EVERY = 25
+FLUSH_SECONDS = 10.0
+
+PSI_WATCH = 0.1
+PSI_DRIFT = 0.25
+# Two-sample KS critical value at alpha = 0.05 is KS_C_ALPHA * sqrt((n + m) / (n * m))
+KS_C_ALPHA = 1.358
+# Floor for empty bins so PSI stays finite
+PSI_EPSILON = 1e-4
+# A fold lock older than this was left by a crashed viewer
+FOLD_LOCK_SECONDS = 60.0
+
+
+class Histogram:
+    """Counts over the bins (-inf, c0), [c0, c1), ..., [c_last, inf) of sorted cut points."""
+
+    def __init__(self, cuts, counts=None):
+        self.cuts = [float(c) for c in cuts]
+        self.counts = np.zeros(len(self.cuts) + 1, dtype=np.int64) if counts is None else np.array(counts, dtype=np.int64)
+
+    def add(self, value):
+        self.counts[bisect.bisect_right(self.cuts, value)] += 1
+
+    def add_many(self, values):
+        bins = np.searchsorted(self.cuts, np.asarray(values, dtype=np.float64), side='right')
+        self.counts += np.bincount(bins, minlength=len(self.counts))
+
+    @property
+    def total(self):
+        return int(self.counts.sum())
+
+    def proportions(self):
+        return self.counts / max(self.total, 1)
+
+
+def _source_signature(csv_path):
+    stat = os.stat(csv_path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def _read_columns(csv_path, names):
+    """{name: float array of its non-empty values} for the named columns of csv_path."""
+    with open(csv_path, newline='') as f:
+        reader = csv.reader(f)
+        # Match on stripped names, as AdmissionSchema does for 'LOR '
+        header = [c.strip() for c in next(reader)]
+        positions = {name: header.index(name) for name in names}
+        values = {name: [] for name in names}
+        for row in reader:
+            for name, i in positions.items():
+                if row[i].strip():
+                    values[name].append(float(row[i]))
+    return {name: np.array(column, dtype=np.float64) for name, column in values.items()}
+
+
+def build_reference(app):
+    """Decile cut points and counts for every feature of app's training CSV."""
+    spec = REFERENCES[app]
+    columns = _read_columns(spec['dataset'], spec['features'])
+    features = {}
+    for feature in spec['features']:
+        values = columns[feature]
+        cuts = np.unique(np.quantile(values, np.linspace(0, 1, BINS + 1)[1:-1]))
+        histogram = Histogram(cuts)
+        histogram.add_many(values)
+        features[feature] = {'cuts': histogram.cuts, 'counts': histogram.counts.tolist()}
+    # Live counts are only comparable with a reference that has the same cut points
+    reference_id = hashlib.sha256(
+        json.dumps({f: v['cuts'] for f, v in features.items()}).encode('utf-8')).hexdigest()[:16]
+    return {
+        'version': FORMAT_VERSION,
+        'app': app,
+        'reference_id': reference_id,
+        'source': _source_signature(spec['dataset']),
+        'features': features,
+    }
+
+
+def _read_json(path):
+    try:
+        with open(path) as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return None  # Missing, or being replaced by its writer
+    return payload if isinstance(payload, dict) else None
+
+
+def _write_json(path, payload):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(payload, f)
+    os.replace(tmp_path, path)
+
+
+def load_reference(app, directory=DRIFT_DIR):
+    """Reference histograms for app, read from the sidecar and rebuilt when the training CSV changes."""
+    path = os.path.join(directory, f"{app}-reference.json")
+    dataset = REFERENCES[app]['dataset']
+    reference = None
+    if os.path.exists(path):
+        with open(path) as f:
+            reference = json.load(f)
+        if reference.get('version') != FORMAT_VERSION:
+            reference = None
+        elif os.path.exists(dataset) and reference['source'] != _source_signature(dataset):
+            reference = None
+    if reference is None:
+        if not os.path.exists(dataset):
+            raise FileNotFoundError(f"Neither {path} nor {dataset} is available for the {app} drift reference")
+        reference = build_reference(app)
+        try:
+            _write_json(path, reference)
+        except OSError:
+            pass  # Read-only deployment: keep the in-memory reference
+    return reference
+
+
+def _reset_time(app, directory):
+    try:
+        return os.stat(os.path.join(directory, f"{app}-reset")).st_mtime
+    except OSError:
+        return 0.0
+
+
+def _histograms(reference):
+    return {f: Histogram(v['cuts'], v['counts']) for f, v in reference['features'].items()}
+
+
+class DriftMonitor:
+    def __init__(self, app, directory=DRIFT_DIR, flush_every=FLUSH_EVERY, flush_seconds=FLUSH_SECONDS):
+        self.app = app
+        self.reference = load_reference(app, directory)
+        self.features = REFERENCES[app]['features']
+        self.flush_every = flush_every
+        self.flush_seconds = flush_seconds
+        self.path = os.path.join(directory, f"{app}-live-{socket.gethostname()}-{os.getpid()}.json")
+        self.live = {f: Histogram(v['cuts']) for f, v in self.reference['features'].items()}
+        self.directory = directory
+        self._since = time.time()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._resume()
+        atexit.register(self.flush)
+
+    def _resume(self):
+        # A restarted process that reuses a pid keeps counting into the same file
+        saved = _read_json(self.path)
+        if saved is None:
+            return
+        if (saved.get('version') == FORMAT_VERSION and saved.get('reference_id') == self.reference['reference_id']
+                and saved.get('since', 0.0) >= _reset_time(self.app, self.directory)):
+            self._since = saved['since']
+            for feature, counts in saved['counts'].items():
+                self.live[feature].counts += np.array(counts, dtype=np.int64)
+
+    def observe(self, values):
+        """Count one request, given as feature values in REFERENCES[app]['features'] order."""
+        if len(values) != len(self.features):
+            raise ValueError(f"Expected {len(self.features)} feature values for {self.app}, got {len(values)}")
+        with self._lock:
+            for feature, value in zip(self.features, values):
+                self.live[feature].add(float(value))
+            self._pending += 1
+            due = (self._pending >= self.flush_every
+                   or time.monotonic() - self._last_flush >= self.flush_seconds)
+        if due:
+            self.flush()
+
+    def flush(self):
+        reset_at = _reset_time(self.app, self.directory)
+        with self._lock:
+            if not self._pending:
+                return
+            if reset_at > self._since:
+                # Reset from the admin view since this process started counting: drop everything counted so far
+                for histogram in self.live.values():
+                    histogram.counts[:] = 0
+                self._since = time.time()
+                self._pending = 0
+                return
+            payload = {
+                'version': FORMAT_VERSION,
+                'app': self.app,
+                'reference_id': self.reference['reference_id'],
+                'host': socket.gethostname(),
+                'pid': os.getpid(),
+                'since': self._since,
+                'updated': time.time(),
+                'counts': {f: h.counts.tolist() for f, h in self.live.items()},
+            }
+            self._pending = 0
+            self._last_flush = time.monotonic()
+        try:
+            _write_json(self.path, payload)
+        except OSError:
+            pass  # Counts stay in memory and are retried on the next flush
+
+
+_monitors = {}
+_monitors_lock = threading.Lock()
+
+
+def get_monitor(app):
+    """The process-wide monitor for app, or None when DRIFT_MONITOR is off or no reference is available."""
+    if not ENABLED:
+        return None
+    with _monitors_lock:
+        if app not in _monitors:
+            try:
+                _monitors[app] = DriftMonitor(app)
+            except FileNotFoundError as e:
+                logger.warning("Drift monitoring disabled for %s: %s", app, e)
+                _monitors[app] = None
+        return _monitors[app]
+
+
+def _process_exists(pid):
+    if not isinstance(pid, int) or isinstance(pid, bool) or pid <= 0:
+        return False  # Truncated or hand-edited file: nothing is writing to it
+    if os.name == 'nt':
+        return True  # os.kill would terminate the process on Windows, so exited ones are never folded there
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # Exists, owned by another user
+    return True
+
+
+def _fold_exited(app, reference, directory):
+    """Add the live files of this host's exited processes into <app>-live-exited.json and delete them."""
+    lock_path = os.path.join(directory, f"{app}-fold.lock")
+    try:
+        os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except FileExistsError:
+        # Another viewer is folding; a lock left behind by a crashed one is cleared for next time
+        try:
+            if time.time() - os.stat(lock_path).st_mtime > FOLD_LOCK_SECONDS:
+                os.remove(lock_path)
+        except OSError:
+            pass
+        return
+    except OSError:
+        return  # Read-only directory
+    try:
+        host = socket.gethostname()
+        archive_path = os.path.join(directory, f"{app}-live-exited.json")
+        archive = _read_json(archive_path)
+        if (archive is None or archive.get('version') != FORMAT_VERSION
+                or archive.get('reference_id') != reference['reference_id']):
+            archive = {
+                'version': FORMAT_VERSION,
+                'app': app,
+                'reference_id': reference['reference_id'],
+                'since': time.time(),
+                'counts': {f: [0] * len(v['counts']) for f, v in reference['features'].items()},
+            }
+        exited = []
+        for path in glob.glob(os.path.join(directory, f"{app}-live-*.json")):
+            saved = _read_json(path)
+            if (path == archive_path or saved is None or saved.get('host') != host
+                    or _process_exists(saved.get('pid'))):
+                continue
+            if not isinstance(saved.get('pid'), int):
+                logger.warning("Drift live file %s has no valid pid; folding it as exited", path)
+            # Files counted against another reference are never merged again, so they are just deleted
+            if saved.get('version') == FORMAT_VERSION and saved.get('reference_id') == reference['reference_id']:
+                try:
+                    folded = {
+                        f: (np.array(archive['counts'][f]) + np.array(saved['counts'][f], dtype=np.int64)).tolist()
+                        for f in archive['counts'] if f in saved['counts']
+                    }
+                    since = min(archive['since'], float(saved['since']))
+                except (KeyError, TypeError, ValueError):
+                    logger.warning("Drift live file %s is malformed; deleting it without folding", path)
+                else:
+                    archive['counts'].update(folded)
+                    archive['since'] = since
+            exited.append(path)
+        if exited:
+            archive['updated'] = time.time()
+            _write_json(archive_path, archive)
+            for path in exited:
+                os.remove(path)
+    except OSError:
+        pass  # Left for the next merge
+    finally:
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
+
+
+def live_histograms(app, reference, directory=DRIFT_DIR):
+    """Live counts merged across every process that scored app against this reference."""
+    _fold_exited(app, reference, directory)
+    merged = {f: Histogram(v['cuts']) for f, v in reference['features'].items()}
+    for path in glob.glob(os.path.join(directory, f"{app}-live-*.json")):
+        saved = _read_json(path)
+        if saved is None:
+            continue
+        if saved.get('version') != FORMAT_VERSION or saved.get('reference_id') != reference['reference_id']:
+            continue
+        for feature, counts in saved['counts'].items():
+            if feature in merged:
+                merged[feature].counts += np.array(counts, dtype=np.int64)
+    return merged
+
+
+def psi(reference, live):
+    expected = np.maximum(reference.proportions(), PSI_EPSILON)
+    actual = np.maximum(live.proportions(), PSI_EPSILON)
+    return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+
+def ks_statistic(reference, live):
+    return float(np.abs(np.cumsum(reference.proportions()) - np.cumsum(live.proportions())).max())
+
+
+def ks_critical(n, m):
+    return KS_C_ALPHA * math.sqrt((n + m) / (n * m))
+
+
+def histograms(app, directory=DRIFT_DIR):
+    """({feature: reference histogram}, {feature: merged live histogram}) for app."""
+    reference = load_reference(app, directory)
+    return _histograms(reference), live_histograms(app, reference, directory)
+
+
+def compare(references, live):
+    """One entry per feature: reference and live counts, PSI, KS statistic and critical value, and a status."""
+    report = []
+    for feature, ref in references.items():
+        cur = live[feature]
+        entry = {
+            'feature': feature, 'reference_rows': ref.total, 'live_rows': cur.total,
+            'psi': None, 'ks': None, 'ks_critical': None, 'status': 'no data',
+        }
+        if cur.total:
+            entry['psi'] = psi(ref, cur)
+            entry['ks'] = ks_statistic(ref, cur)
+            entry['ks_critical'] = ks_critical(ref.total, cur.total)
+            if entry['psi'] >= PSI_DRIFT or entry['ks'] > entry['ks_critical']:
+                entry['status'] = 'drift'
+            elif entry['psi'] >= PSI_WATCH:
+                entry['status'] = 'watch'
+            else:
+                entry['status'] = 'stable'
+        report.append(entry)
+    return report
+
+
+def drift_report(app, directory=DRIFT_DIR):
+    return compare(*histograms(app, directory))
+
+
+def bin_labels(histogram):
+    """Readable labels for each bin of histogram, e.g. '< 308', '[308, 312)', '>= 330'."""
+    cuts = [f"{c:g}" for c in histogram.cuts]
+    if not cuts:
+        return ['all']
+    return [f"< {cuts[0]}"] + [f"[{a}, {b})" for a, b in zip(cuts, cuts[1:])] + [f">= {cuts[-1]}"]
+
+
+def reset(app, directory=DRIFT_DIR):
+    """Forget the live counts for app.
+
+    Files written so far are deleted, and running processes see the reset
+    marker at their next flush and drop what they have counted since.
+    """
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, f"{app}-reset"), 'w') as f:
+        f.write(f"{time.time()}\n")
+    for path in glob.glob(os.path.join(directory, f"{app}-live-*.json")):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--apps', nargs='+', choices=sorted(REFERENCES), default=list(REFERENCES))
+    parser.add_argument('--reset', action='store_true', help='delete the live counts instead of reporting')
+    args = parser.parse_args()
+
+    for app in args.apps:
+        if args.reset:
+            reset(app)
+            print(f"{app}: live counts cleared")
+            continue
+        print(f"{app}:")
+        for entry in drift_report(app):
+            if entry['live_rows']:
+                print(f"    {entry['feature']:<26} live {entry['live_rows']:>7}  PSI {entry['psi']:6.3f}  "
+                      f"KS {entry['ks']:.3f} (crit {entry['ks_critical']:.3f})  {entry['status']}")
+            else:
+                print(f"    {entry['feature']:<26} no live requests yet")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,41 @@
+"""Rolling latency tracking against a per-request budget."""
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+
+class LatencyTracker:
+    def __init__(self, budget_ms, window=1000):
+        self.budget_ms = budget_ms
+        self._samples = deque(maxlen=window)
+        self._over_budget = 0
+        self._lock = threading.Lock()
+
+    def record(self, elapsed_ms):
+        with self._lock:
+            self._samples.append(elapsed_ms)
+            if elapsed_ms > self.budget_ms:
+                self._over_budget += 1
+
+    @contextmanager
+    def measure(self):
+        timing = {}
+        start = time.perf_counter()
+        try:
+            yield timing
+        finally:
+            timing['elapsed_ms'] = (time.perf_counter() - start) * 1000
+            timing['over_budget'] = timing['elapsed_ms'] > self.budget_ms
+            self.record(timing['elapsed_ms'])
+
+    def summary(self):
+        with self._lock:
+            samples = np.array(self._samples)
+            over_budget = self._over_budget
+        if samples.size == 0:
+            return {'count': 0, 'p50_ms': None, 'p99_ms': None, 'over_budget': 0}
+        p50, p99 = np.percentile(samples, [50, 99])
+        return {'count': int(samples.size), 'p50_ms': float(p50), 'p99_ms': float(p99), 'over_budget': over_budget}
@@ -0,0 +1,246 @@
+"""Multi-process launcher: load the models once, then fork workers that share them.
+
+The parent process loads each artifact bundle the target needs through the
+model registry and unpickles the model objects the target touches. For the
+scoring service it builds the service's models as well. It then freezes the
+garbage collector's view of those objects (gc.freeze) and forks. Workers
+inherit everything copy-on-write:
+
+- the LightGBM booster and the sklearn/statsmodels objects stay in pages
+  shared with the parent;
+- the registry's numeric arrays are already memory-mapped .npy files, so
+  they were shared between processes anyway.
+
+gc.freeze keeps the collector from writing to the inherited objects' headers,
+which would otherwise copy their pages into every worker.
+
+Targets:
+
+    python launcher.py scoring --workers 4 --port 8000
+        scoring_service workers accepting on one shared listening socket
+    python launcher.py ola_pred.py --workers 4 --port 8501
+        Streamlit workers on ports 8501-8504, for a load balancer in front
+
+Every --report-interval seconds the launcher logs the RSS, PSS, shared and
+private memory of the parent and each worker (Linux /proc). PSS splits
+shared pages between the processes mapping them, so the PSS total is what
+the node really spends. A worker that dies is forked again from the
+preloaded parent. --no-preload forks first and lets every worker load its
+own models, for comparison.
+"""
+import argparse
+import gc
+import logging
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+
+import model_registry
+
+logger = logging.getLogger(__name__)
+
+SCORING = 'scoring'
+# Streamlit apps -> {bundle: attributes the app touches}; the numeric arrays come with every bundle.
+# The admission app reads the few-KB admission_ols.json export instead of a registry bundle.
+APPS = {
+    'Admission_pred.py': {},
+    'loantap_pred.py': {'loantap': ()},
+    'ola_pred.py': {'ola': ('model',)},
+    'stock_market.py': {},
+}
+# A worker that exits sooner than this after being forked is treated as a startup failure, not respawned
+MIN_UPTIME_SECONDS = 5.0
+
+
+def memory_usage(pid):
+    """{'rss', 'pss', 'shared', 'private'} in bytes for pid, or None where /proc/<pid>/smaps_rollup is unavailable."""
+    fields = {}
+    try:
+        with open(f'/proc/{pid}/smaps_rollup') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                parts = value.split()
+                if len(parts) == 2 and parts[1] == 'kB':
+                    fields[key] = int(parts[0]) * 1024
+    except OSError:
+        return None
+    return {
+        'rss': fields.get('Rss', 0),
+        'pss': fields.get('Pss', 0),
+        'shared': fields.get('Shared_Clean', 0) + fields.get('Shared_Dirty', 0),
+        'private': fields.get('Private_Clean', 0) + fields.get('Private_Dirty', 0),
+    }
+
+
+class Launcher:
+    def __init__(self, target, workers, host='127.0.0.1', port=8000, preload=True,
+                 models=None, max_batch=128, window_ms=2.0):
+        if target != SCORING and target not in APPS:
+            raise ValueError(f"Unknown target {target!r}; expected {SCORING!r} or one of {', '.join(APPS)}")
+        self.target = target
+        self.worker_count = workers
+        self.host = host
+        self.port = port
+        self.preload = preload
+        self.model_names = models
+        self.max_batch = max_batch
+        self.window_ms = window_ms
+        self.models = None
+        self.listener = None
+        self.workers = {}   # slot -> (pid, start time)
+        self.stopping = False
+
+    def load(self):
+        """Load what the workers will use, so forked workers share it instead of loading their own copy.
+
+        Returns False, after logging the missing artifact, when the target's artifacts cannot be loaded.
+        """
+        start = time.perf_counter()
+        if self.target == SCORING:
+            from scoring_service import load_models
+
+            self.models = load_models(self.model_names)
+        else:
+            import streamlit  # noqa: F401  Imported once here rather than in every worker
+            from streamlit.web import bootstrap  # noqa: F401
+
+            try:
+                for name, attributes in APPS[self.target].items():
+                    bundle = model_registry.get(name)
+                    for attribute in attributes:
+                        getattr(bundle, attribute)
+            except (model_registry.ArtifactError, FileNotFoundError) as e:
+                logger.error("Cannot preload %s: %s", self.target, e)
+                return False
+        # Objects that exist now are never collected, so the collector never touches their pages again
+        gc.collect()
+        gc.freeze()
+        logger.info("Preloaded %s in %.0f ms", self.target, (time.perf_counter() - start) * 1000)
+        return True
+
+    def listen(self):
+        self.listener = socket.create_server((self.host, self.port), backlog=128)
+
+    def spawn(self, slot):
+        pid = os.fork()
+        if pid:
+            self.workers[slot] = (pid, time.monotonic())
+            return
+        code = 0
+        try:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            self._serve(slot)
+        except BaseException:
+            logger.exception("Worker %d failed", slot)
+            code = 1
+        finally:
+            os._exit(code)
+
+    def _serve(self, slot):
+        if self.target == SCORING:
+            from scoring_service import ScoringService, make_server
+
+            service = ScoringService(self.model_names, self.max_batch, self.window_ms, models=self.models)
+            server = make_server(service, sock=self.listener)
+            logger.info("Worker %d (pid %d) serving %s", slot, os.getpid(), ', '.join(sorted(service.models)))
+            server.serve_forever()
+        else:
+            from streamlit.web import bootstrap
+
+            flag_options = {'server.port': self.port + slot, 'server.address': self.host, 'server.headless': True}
+            bootstrap.load_config_options(flag_options)
+            logger.info("Worker %d (pid %d) serving %s on port %d", slot, os.getpid(), self.target, self.port + slot)
+            bootstrap.run(self.target, False, [], flag_options)
+
+    def report(self):
+        processes = [('parent', os.getpid())] + [(f'worker {slot}', pid) for slot, (pid, _) in sorted(self.workers.items())]
+        total = 0
+        lines = [f"{'process':<10} {'pid':>7} {'RSS MB':>8} {'PSS MB':>8} {'shared MB':>10} {'private MB':>11}"]
+        for label, pid in processes:
+            usage = memory_usage(pid)
+            if usage is None:
+                lines.append(f"{label:<10} {pid:>7}   (memory usage unavailable)")
+                continue
+            total += usage['pss']
+            lines.append(
+                f"{label:<10} {pid:>7} {usage['rss'] / 2**20:8.1f} {usage['pss'] / 2**20:8.1f} "
+                f"{usage['shared'] / 2**20:10.1f} {usage['private'] / 2**20:11.1f}"
+            )
+        lines.append(f"total PSS: {total / 2**20:.1f} MB")
+        logger.info("Memory by process:\n%s", '\n'.join(lines))
+
+    def _stop(self, signum, frame):
+        self.stopping = True
+
+    def run(self, report_interval=30.0):
+        if threading.active_count() > 1:
+            logger.warning("Forking with %d threads running; only the forking thread exists in workers",
+                           threading.active_count())
+        if self.target == SCORING:
+            self.listen()
+        if self.preload and not self.load():
+            return 1
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+        for slot in range(self.worker_count):
+            self.spawn(slot)
+
+        next_report = time.monotonic() + report_interval
+        exit_code = 0
+        while not self.stopping:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid:
+                slot = next((s for s, (p, _) in self.workers.items() if p == pid), None)
+                if slot is not None:
+                    started = self.workers.pop(slot)[1]
+                    logger.warning("Worker %d (pid %d) exited with status %d", slot, pid, os.waitstatus_to_exitcode(status))
+                    if time.monotonic() - started < MIN_UPTIME_SECONDS:
+                        logger.error("Worker %d failed during startup; stopping", slot)
+                        exit_code = 1
+                        break
+                    self.spawn(slot)
+                continue
+            if report_interval and time.monotonic() >= next_report:
+                self.report()
+                next_report = time.monotonic() + report_interval
+            time.sleep(0.2)
+
+        for pid, _ in self.workers.values():
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid, _ in self.workers.values():
+            os.waitpid(pid, 0)
+        return exit_code
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('target', choices=[SCORING, *APPS], help='the scoring service or a Streamlit app')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, help='listening port (first of consecutive ports for Streamlit apps)')
+    parser.add_argument('--no-preload', dest='preload', action='store_false',
+                        help='let every worker load its own models (for comparison)')
+    parser.add_argument('--report-interval', type=float, default=30.0, help='seconds between memory reports (0: never)')
+    parser.add_argument('--models', nargs='+', choices=sorted(model_registry.ARTIFACTS), help='scoring only: models to serve (default: all)')
+    parser.add_argument('--max-batch', type=int, default=128, help='scoring only: largest micro-batch per model call')
+    parser.add_argument('--batch-window-ms', type=float, default=2.0, help='scoring only: how long a micro-batch waits to fill')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+    port = args.port or (8000 if args.target == SCORING else 8501)
+    launcher = Launcher(
+        args.target, args.workers, args.host, port, preload=args.preload,
+        models=args.models, max_batch=args.max_batch, window_ms=args.batch_window_ms,
+    )
+    return launcher.run(args.report_interval)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
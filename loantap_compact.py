@@ -0,0 +1,176 @@
+"""Fused float32 export of the LoanTap scaler + logistic regression.
+
+The StandardScaler is folded into the coefficients, as admission_engine does
+for the OLS model:
+
+    z = b + sum(w_j * (x_j - mean_j) / scale_j)
+      = (b - sum(w'_j * mean_j)) + sum(w'_j * x_j),   w'_j = w_j / scale_j
+
+leaving one float32 weight per model column plus a bias. A one-hot column is
+either 0 or 1, so its contribution is just its weight when the category is
+present: an application is scored with a dot product over the few numeric
+fields plus one table lookup per categorical field, never building the
+42-column row. Dense encoded rows (LoanTapEncoder output) can be scored
+with a single matrix-vector product instead.
+
+    python loantap_compact.py              # export next to the registry cache
+    python loantap_compact.py --output loantap_compact.npz
+"""
+import argparse
+import json
+import math
+import os
+import sys
+
+import numpy as np
+
+import model_registry
+from loantap_features import LoanTapEncoder, UnknownCategoryError
+from loantap_schema import load_schema
+
+COMPACT_FILE = 'compact.npz'
+FORMAT_VERSION = 1
+
+
+class CompactLoanTapModel:
+    def __init__(self, model_version, weights, bias, numeric_slots, vocabulary, category_slots, positive_class=1):
+        self.model_version = model_version
+        self.weights = np.ascontiguousarray(weights, dtype=np.float32)
+        self.bias = np.float32(bias)
+        self.numeric_fields = [field for field, _ in numeric_slots]
+        self.numeric_index = np.array([i for _, i in numeric_slots], dtype=np.int64)
+        self.numeric_weights = self.weights[self.numeric_index]
+        self.vocabulary = {field: list(vocab) for field, vocab in vocabulary.items()}
+        self.category_slots = {field: np.asarray(slots, dtype=np.int64) for field, slots in category_slots.items()}
+        self.positive_class = positive_class
+        # Weight contributed by each category (0 for reference levels and fields the model does not use)
+        self.tables = {
+            field: np.where(slots >= 0, self.weights[np.maximum(slots, 0)], 0).astype(np.float32)
+            for field, slots in self.category_slots.items()
+        }
+        self._lookup = {
+            field: dict(zip(vocab, self.tables[field].tolist())) for field, vocab in self.vocabulary.items()
+        }
+        self._numeric_weights = list(zip(self.numeric_fields, self.numeric_weights.tolist()))
+        self._bias = float(self.bias)
+
+    @classmethod
+    def from_bundle(cls, bundle, encoder):
+        arrays = bundle.arrays
+        coef = np.asarray(arrays['coef'], dtype=np.float64)
+        if coef.shape[0] != 1:
+            raise ValueError(f"Expected a binary logistic regression, got {coef.shape[0]} coefficient rows")
+        weights = coef[0] / arrays['scaler_scale']
+        bias = float(arrays['intercept'][0]) - float(np.dot(weights, arrays['scaler_mean']))
+        # Class labels come from the registry cache, so exporting never unpickles the sklearn model
+        return cls(
+            bundle.version, weights, bias, encoder.numeric_slots, encoder.vocabulary, encoder.category_slots,
+            positive_class=bundle.classes[1],
+        )
+
+    def save(self, path):
+        meta = {
+            'format': FORMAT_VERSION,
+            'model_version': self.model_version,
+            'numeric_slots': [[f, int(i)] for f, i in zip(self.numeric_fields, self.numeric_index)],
+            'vocabulary': self.vocabulary,
+            'positive_class': int(self.positive_class),
+        }
+        staging = f"{path}.tmp.npz"
+        np.savez(
+            staging, weights=self.weights, bias=np.array([self.bias]), meta=np.array(json.dumps(meta)),
+            **{f"slots_{field}": slots for field, slots in self.category_slots.items()},
+        )
+        os.replace(staging, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            meta = json.loads(str(data['meta']))
+            if meta['format'] != FORMAT_VERSION:
+                raise ValueError(f"{path}: unsupported compact format {meta['format']}")
+            slots = {field: data[f"slots_{field}"] for field in meta['vocabulary']}
+            return cls(
+                meta['model_version'], data['weights'], data['bias'][0], meta['numeric_slots'],
+                meta['vocabulary'], slots, meta['positive_class'],
+            )
+
+    @classmethod
+    def for_bundle(cls, bundle, encoder):
+        """Load the export for this artifact version, creating it in the registry cache on first use."""
+        path = os.path.join(model_registry.CACHE_DIR, f"{bundle.name}-{bundle.version}", COMPACT_FILE)
+        if os.path.exists(path):
+            compact = cls.load(path)
+            if compact.model_version == bundle.version and compact.vocabulary == encoder.vocabulary:
+                return compact
+        compact = cls.from_bundle(bundle, encoder)
+        try:
+            compact.save(path)
+        except OSError:
+            pass  # Read-only cache: keep the in-memory export
+        return compact
+
+    def decision_one(self, record):
+        z = self._bias
+        for field, w in self._numeric_weights:
+            z += w * record[field]
+        for field, lookup in self._lookup.items():
+            value = str(record[field])
+            if value not in lookup:
+                raise UnknownCategoryError(f"Unknown {field} category {value!r}")
+            z += lookup[value]
+        return z
+
+    def predict_one(self, record):
+        """(approved, probability of the positive class) for one application."""
+        z = self.decision_one(record)
+        return z > 0, 1.0 / (1.0 + math.exp(-z))
+
+    def decision_function(self, records):
+        """Decision values for a DataFrame (or dict of columns) of raw applications."""
+        import pandas as pd
+
+        frame = pd.DataFrame(records)
+        numeric = np.column_stack([frame[f].to_numpy(dtype=np.float32) for f in self.numeric_fields])
+        z = numeric @ self.numeric_weights + self.bias
+        for field, vocab in self.vocabulary.items():
+            codes = pd.Categorical(frame[field].astype(str), categories=vocab).codes
+            if (codes < 0).any():
+                unknown = sorted(set(frame[field].astype(str)[codes < 0]))
+                raise UnknownCategoryError(f"Unknown {field} categories: {', '.join(repr(v) for v in unknown)}")
+            z += self.tables[field][codes]
+        return z
+
+    def decision_dense(self, rows):
+        """Decision values for (n_rows, n_features) rows in model column order, e.g. LoanTapEncoder output."""
+        return np.asarray(rows, dtype=np.float32) @ self.weights + self.bias
+
+    @staticmethod
+    def probability(z):
+        return 1.0 / (1.0 + np.exp(-z))
+
+    def predict_proba(self, records):
+        return self.probability(self.decision_function(records))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', help='write the export here instead of the registry cache')
+    args = parser.parse_args()
+
+    bundle = model_registry.get('loantap')
+    encoder = LoanTapEncoder(bundle.feature_names, load_schema()['options'])
+    if args.output:
+        compact = CompactLoanTapModel.from_bundle(bundle, encoder)
+        compact.save(args.output)
+        path = args.output
+    else:
+        compact = CompactLoanTapModel.for_bundle(bundle, encoder)
+        path = os.path.join(model_registry.CACHE_DIR, f"{bundle.name}-{bundle.version}", COMPACT_FILE)
+    print(f"Exported {len(compact.weights)} fused float32 weights for loantap {bundle.version} -> {path} "
+          f"({os.path.getsize(path)} bytes)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
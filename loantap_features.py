@@ -0,0 +1,77 @@
+"""Compiled one-hot feature encoder for the LoanTap model.
+
+Replaces the per-rerun DataFrame + pd.get_dummies + reindex path. The column
+layout is resolved once from the scaler's feature_columns: numeric fields map
+to a fixed column index and every category in the schema options maps to the
+index of its one-hot column (or to no column, for dropped reference levels and
+fields the model does not use). Encoding is then plain index assignment into a
+preallocated NumPy array, for one record or a whole batch.
+
+Categories outside the known vocabulary raise UnknownCategoryError instead of
+silently encoding as all zeros.
+"""
+import numpy as np
+
+from loantap_schema import CATEGORICAL_FIELDS
+
+NUMERIC_FIELDS = ['loan_amnt', 'term', 'int_rate', 'dti', 'annual_inc', 'Credit_History_Years']
+
+
+class UnknownCategoryError(ValueError):
+    pass
+
+
+class LoanTapEncoder:
+    def __init__(self, feature_columns, options):
+        self.feature_columns = [str(c) for c in feature_columns]
+        index = {c: i for i, c in enumerate(self.feature_columns)}
+        self.n_features = len(self.feature_columns)
+
+        # Numeric fields the model does not use are accepted and ignored, as reindex did
+        self.numeric_slots = [(field, index[field]) for field in NUMERIC_FIELDS if field in index]
+
+        self.vocabulary = {}
+        self.category_slots = {}
+        for field in CATEGORICAL_FIELDS:
+            prefix = f"{field}_"
+            # The vocabulary is the schema's options, not every column named like "<field>_...":
+            # purpose_encoded is a numeric label-encoded column, not a 'purpose' category
+            vocab = list(dict.fromkeys(str(v) for v in options.get(field, [])))
+            self.vocabulary[field] = vocab
+            # -1 marks categories without a column (reference level or field unused by the model)
+            self.category_slots[field] = np.array([index.get(prefix + v, -1) for v in vocab], dtype=np.int64)
+        self._lookup = {
+            field: dict(zip(vocab, self.category_slots[field].tolist())) for field, vocab in self.vocabulary.items()
+        }
+
+    def encode_one(self, record):
+        row = np.zeros(self.n_features, dtype=np.float64)
+        for field, i in self.numeric_slots:
+            row[i] = record[field]
+        for field, lookup in self._lookup.items():
+            value = str(record[field])
+            if value not in lookup:
+                raise UnknownCategoryError(f"Unknown {field} category {value!r}")
+            i = lookup[value]
+            if i >= 0:
+                row[i] = 1.0
+        return row
+
+    def encode(self, records):
+        """Encode a DataFrame (or dict of columns) into an (n_rows, n_features) array."""
+        import pandas as pd
+
+        frame = pd.DataFrame(records)
+        out = np.zeros((len(frame), self.n_features), dtype=np.float64)
+        for field, i in self.numeric_slots:
+            out[:, i] = frame[field].to_numpy(dtype=np.float64)
+        rows = np.arange(len(frame))
+        for field, vocab in self.vocabulary.items():
+            codes = pd.Categorical(frame[field].astype(str), categories=vocab).codes
+            if (codes < 0).any():
+                unknown = sorted(set(frame[field].astype(str)[codes < 0]))
+                raise UnknownCategoryError(f"Unknown {field} categories: {', '.join(repr(v) for v in unknown)}")
+            columns = self.category_slots[field][codes]
+            hit = columns >= 0
+            out[rows[hit], columns[hit]] = 1.0
+        return out
@@ -0,0 +1,172 @@
+"""Incrementally maintained approval-rate aggregates for the LoanTap dataset.
+
+Per-category application and approval counts for INSIGHT_FIELDS are kept in
+a small JSON sidecar next to logistic_regression.csv, together with the byte
+offset of the last row folded in. When rows are appended to the CSV only the
+new bytes are read and added to the counts. The aggregates are rebuilt from
+scratch when the already-counted part of the file may have changed: the
+file shrank or was replaced (new inode), it was modified without growing
+(same size, new mtime), or the first or last HEAD_BYTES bytes before the
+counted offset hash differently. Rows are
+split on newlines, so quoted fields must not contain line breaks. A last row
+without a trailing newline is counted once it has every column; if more of
+that same row is written later, the aggregates are rebuilt.
+"""
+import csv
+import hashlib
+import io
+import json
+import os
+
+import pandas as pd
+
+from loantap_schema import DATASET
+
+AGGREGATES_PATH = 'loantap_insights.json'
+AGGREGATES_VERSION = 2
+
+INSIGHT_FIELDS = ['grade', 'purpose', 'home_ownership', 'verification_status']
+TARGET_FIELD = 'loan_status'
+APPROVED_STATUS = 'Fully Paid'
+HEAD_BYTES = 65536
+READ_BLOCK = 64 * 1024 * 1024
+
+
+def _counted_hash(csv_path, length):
+    # The first and the last HEAD_BYTES bytes of the counted region, where edits are most likely
+    digest = hashlib.sha256()
+    with open(csv_path, 'rb') as f:
+        digest.update(f.read(min(length, HEAD_BYTES)))
+        f.seek(max(length - HEAD_BYTES, 0))
+        digest.update(f.read(length - f.tell()))
+    return digest.hexdigest()
+
+
+def _file_identity(stat):
+    return {'inode': stat.st_ino, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def _empty_aggregates(header):
+    return {
+        'version': AGGREGATES_VERSION,
+        'source': {'header': header, 'offset': 0, 'counted_sha256': None, 'file': None},
+        'rows': 0,
+        'groups': {field: {} for field in INSIGHT_FIELDS},
+    }
+
+
+def _fold(aggregates, frame):
+    # Same rewrite the app applies to home_ownership before encoding
+    frame = frame.dropna(subset=[TARGET_FIELD])
+    frame = frame.assign(
+        home_ownership=frame['home_ownership'].replace({'ANY': 'OTHER', 'NONE': 'OTHER'}),
+        approved=(frame[TARGET_FIELD] == APPROVED_STATUS).astype(int),
+    )
+    for field in INSIGHT_FIELDS:
+        counts = frame.groupby(frame[field].astype(str))['approved'].agg(['size', 'sum'])
+        groups = aggregates['groups'][field]
+        for category, (size, approved) in counts.iterrows():
+            total, ok = groups.get(category, [0, 0])
+            groups[category] = [total + int(size), ok + int(approved)]
+    aggregates['rows'] += len(frame)
+
+
+def _is_complete_row(data, width):
+    # strict: a quoted field cut off by the end of the data is an error, not a shorter field
+    try:
+        fields = next(csv.reader([data.decode('utf-8')], strict=True), [])
+    except (UnicodeDecodeError, csv.Error):
+        return False
+    return len(fields) == width
+
+
+def _read_new_rows(csv_path, aggregates):
+    """Fold rows after the stored offset into aggregates; returns True if anything was read."""
+    source = aggregates['source']
+    usecols = INSIGHT_FIELDS + [TARGET_FIELD]
+    read_any = False
+    with open(csv_path, 'rb') as f:
+        stat = os.fstat(f.fileno())
+        size = stat.st_size
+        if source['offset'] == 0:
+            source['header'] = next(csv.reader([f.readline().decode('utf-8').rstrip('\r\n')]))
+            source['offset'] = f.tell()
+        f.seek(source['offset'])
+        while True:
+            block = f.read(READ_BLOCK)
+            end = block.rfind(b'\n') + 1
+            if f.tell() >= size and end < len(block):
+                # The file's last row may lack its newline: count it once it has every field
+                if _is_complete_row(block[end:], len(source['header'])):
+                    end = len(block)
+            if end == 0:
+                break
+            source['unterminated'] = not block[:end].endswith(b'\n')
+            frame = pd.read_csv(io.BytesIO(block[:end]), header=None, names=source['header'], usecols=usecols)
+            _fold(aggregates, frame)
+            source['offset'] += end
+            read_any = True
+            f.seek(source['offset'])
+    source['counted_sha256'] = _counted_hash(csv_path, source['offset'])
+    source['file'] = _file_identity(stat)
+    return read_any
+
+
+def _is_prefix(aggregates, csv_path):
+    source = aggregates['source']
+    if aggregates.get('version') != AGGREGATES_VERSION or not source.get('counted_sha256'):
+        return False
+    current, saved = _file_identity(os.stat(csv_path)), source['file']
+    if current['inode'] != saved['inode'] or current['size'] < source['offset']:
+        return False
+    if current['size'] == saved['size'] and current['mtime_ns'] != saved['mtime_ns']:
+        return False  # Rewritten in place without growing
+    if source.get('unterminated'):
+        # The last counted row had no newline: anything but a line break after it means it grew
+        with open(csv_path, 'rb') as f:
+            f.seek(source['offset'])
+            if f.read(1) not in (b'', b'\n', b'\r'):
+                return False
+    return _counted_hash(csv_path, source['offset']) == source['counted_sha256']
+
+
+def update_aggregates(csv_path=DATASET, aggregates_path=AGGREGATES_PATH):
+    """Load the sidecar, fold in rows appended since it was written, and save it back if it changed."""
+    aggregates = None
+    if os.path.exists(aggregates_path):
+        with open(aggregates_path) as f:
+            aggregates = json.load(f)
+        if not os.path.exists(csv_path):
+            # Deployments may ship the sidecar without the raw dataset
+            return aggregates
+        if not _is_prefix(aggregates, csv_path):
+            aggregates = None
+
+    if aggregates is None:
+        if not os.path.exists(csv_path):
+            raise FileNotFoundError(f"Neither {aggregates_path} nor {csv_path} is available for LoanTap insights")
+        aggregates = _empty_aggregates(header=None)
+        changed = True
+    else:
+        changed = False
+
+    if os.path.getsize(csv_path) > aggregates['source']['offset']:
+        changed = _read_new_rows(csv_path, aggregates) or changed
+
+    if changed:
+        tmp_path = f"{aggregates_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(aggregates, f, indent=2)
+        os.replace(tmp_path, aggregates_path)
+    return aggregates
+
+
+def approval_table(aggregates, field):
+    """Applications, approvals and approval rate (%) per category of field, highest rate first."""
+    groups = aggregates['groups'][field]
+    table = pd.DataFrame(
+        [(category, total, approved) for category, (total, approved) in groups.items()],
+        columns=[field, 'applications', 'approved'],
+    )
+    table['approval_rate'] = table['approved'] / table['applications'] * 100
+    return table.sort_values('approval_rate', ascending=False, ignore_index=True)
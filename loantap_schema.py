@@ -0,0 +1,71 @@
+"""Cached option lists and feature schema for the LoanTap app.
+
+The raw logistic_regression.csv is only needed to fill the selectboxes, so it
+is processed once into a small JSON sidecar. Later cold starts read the
+sidecar; the CSV is re-read only when it changes (size or mtime differs).
+"""
+import json
+import os
+
+DATASET = 'logistic_regression.csv'
+SCHEMA_PATH = 'loantap_schema.json'
+SCHEMA_VERSION = 1
+
+CATEGORICAL_FIELDS = ['purpose', 'verification_status', 'grade', 'home_ownership']
+TERM_OPTIONS = [36, 60]
+
+
+def _source_signature(csv_path):
+    stat = os.stat(csv_path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def build_schema(csv_path=DATASET):
+    # Only needed when the sidecar is (re)built, so app cold starts skip it
+    import pandas as pd
+
+    columns = pd.read_csv(csv_path, nrows=0).columns.tolist()
+    df = pd.read_csv(csv_path, usecols=CATEGORICAL_FIELDS)
+
+    # Same rewrite the app applied to the full dataset
+    df.loc[(df.home_ownership == 'ANY') | (df.home_ownership == 'NONE'), 'home_ownership'] = 'OTHER'
+
+    # Credit_History_Years is derived from the two date columns at training time
+    feature_columns = [c for c in columns if c != 'loan_status'] + ['Credit_History_Years']
+
+    return {
+        'version': SCHEMA_VERSION,
+        'source': _source_signature(csv_path),
+        'feature_columns': feature_columns,
+        'options': {
+            'term': TERM_OPTIONS,
+            **{field: df[field].unique().tolist() for field in CATEGORICAL_FIELDS},
+        },
+    }
+
+
+def _is_current(schema, csv_path):
+    if schema.get('version') != SCHEMA_VERSION:
+        return False
+    if not os.path.exists(csv_path):
+        # Deployments may ship the sidecar without the raw dataset
+        return True
+    return schema.get('source') == _source_signature(csv_path)
+
+
+def load_schema(csv_path=DATASET, schema_path=SCHEMA_PATH):
+    if os.path.exists(schema_path):
+        with open(schema_path) as f:
+            schema = json.load(f)
+        if _is_current(schema, csv_path):
+            return schema
+
+    if not os.path.exists(csv_path):
+        raise FileNotFoundError(f"Neither {schema_path} nor {csv_path} is available to build the LoanTap options")
+
+    schema = build_schema(csv_path)
+    tmp_path = f"{schema_path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(schema, f, indent=2)
+    os.replace(tmp_path, schema_path)
+    return schema
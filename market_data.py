@@ -0,0 +1,286 @@
+"""Incremental on-disk cache for daily market history.
+
+MarketDataStore keeps one Parquet file per ticker under .market_cache/ (or
+MARKET_DATA_CACHE_DIR) plus a small JSON record of which date spans have
+already been fetched. A request for [start, end) only asks the provider for
+the spans not yet covered, merges them into the stored frame and serves
+repeat views from memory (the MEMORY_TICKERS most recently used tickers).
+Tickers must match TICKER_PATTERN, since they name the cache files.
+
+fetch_many() loads a whole watchlist through a bounded thread pool, retrying
+failed tickers with exponential backoff, and aligns the closes into one wide
+frame.
+
+Providers are plain objects with a history(ticker, start, end) method that
+returns a daily OHLCV frame indexed by date. YFinanceProvider is used by
+default; SyntheticProvider generates deterministic prices offline and can be
+selected with MARKET_DATA_PROVIDER=synthetic.
+"""
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.holiday import (
+    AbstractHolidayCalendar, GoodFriday, Holiday, USLaborDay, USMartinLutherKingJr, USMemorialDay, USPresidentsDay,
+    USThanksgivingDay, nearest_workday, sunday_to_monday,
+)
+
+CACHE_DIR = os.environ.get('MARKET_DATA_CACHE_DIR', '.market_cache')
+COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume', 'Dividends', 'Stock Splits']
+# Tickers become cache file names, so only Yahoo-style symbols (MSFT, BRK-B, ^GSPC, EURUSD=X) are accepted
+TICKER_PATTERN = re.compile(r'^[A-Za-z0-9.^=-]{1,15}$')
+# Tickers whose frames are kept in memory; the least recently used are dropped beyond this
+MEMORY_TICKERS = 64
+
+
+def check_ticker(ticker):
+    """ticker stripped and upper-cased, or ValueError if it is not a plain ticker symbol."""
+    ticker = str(ticker).strip().upper()
+    if not TICKER_PATTERN.match(ticker):
+        raise ValueError(f"Invalid ticker {ticker!r}")
+    return ticker
+
+
+class YFinanceProvider:
+    def history(self, ticker, start, end):
+        import yfinance as yf
+
+        return yf.Ticker(ticker).history(start=start, end=end)
+
+
+class SyntheticProvider:
+    """Deterministic random-walk prices, identical for a date whatever span is requested."""
+
+    EPOCH = pd.Timestamp('1980-01-01')
+    HORIZON = pd.Timestamp('2040-12-31')
+
+    def __init__(self, latency=0.0, failure_rate=0.0, seed=0):
+        # latency (seconds) and failure_rate simulate a remote API for offline benchmarks
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.calls = []
+        self._series = {}
+        self._lock = threading.Lock()
+        self._failures = random.Random(seed)
+
+    def _full_series(self, ticker):
+        with self._lock:
+            if ticker not in self._series:
+                seed = int.from_bytes(hashlib.sha256(ticker.encode()).digest()[:8], 'little')
+                rng = np.random.default_rng(seed)
+                days = np.arange(self.EPOCH.date(), self.HORIZON.date(), dtype='datetime64[D]')
+                dates = pd.DatetimeIndex(days[np.is_busday(days)], name='Date')
+                close = 50 * np.exp(np.cumsum(rng.normal(0.0003, 0.015, len(dates))))
+                spread = close * rng.uniform(0.0, 0.02, len(dates))
+                self._series[ticker] = pd.DataFrame({
+                    'Open': close + rng.uniform(-0.5, 0.5, len(dates)) * spread,
+                    'High': close + spread,
+                    'Low': close - spread,
+                    'Close': close,
+                    'Volume': rng.integers(1_000_000, 50_000_000, len(dates)),
+                    'Dividends': 0.0,
+                    'Stock Splits': 0.0,
+                }, index=dates)
+            return self._series[ticker]
+
+    def history(self, ticker, start, end):
+        self.calls.append((ticker, pd.Timestamp(start), pd.Timestamp(end)))
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            failed = self._failures.random() < self.failure_rate
+        if failed:
+            raise ConnectionError(f"Simulated provider failure for {ticker}")
+        series = self._full_series(ticker)
+        return series[(series.index >= pd.Timestamp(start)) & (series.index < pd.Timestamp(end))].copy()
+
+
+def provider_from_env():
+    name = os.environ.get('MARKET_DATA_PROVIDER', 'yfinance')
+    if name == 'synthetic':
+        return SyntheticProvider()
+    if name == 'yfinance':
+        return YFinanceProvider()
+    raise ValueError(f"Unknown MARKET_DATA_PROVIDER {name!r}")
+
+
+def _normalise(frame):
+    # Daily bars: keep the calendar date only, so spans from any source line up
+    frame = frame.reindex(columns=COLUMNS)
+    index = pd.DatetimeIndex(frame.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    frame.index = index.normalize().rename('Date')
+    return frame
+
+
+def _merge_spans(spans):
+    merged = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def _missing_spans(covered, start, end):
+    missing = []
+    cursor = start
+    for span_start, span_end in covered:
+        if span_end <= cursor:
+            continue
+        if span_start >= end:
+            break
+        if span_start > cursor:
+            missing.append((cursor, span_start))
+        cursor = max(cursor, span_end)
+    if cursor < end:
+        missing.append((cursor, end))
+    return missing
+
+
+class ExchangeHolidayCalendar(AbstractHolidayCalendar):
+    """Full-day NYSE closures. Other exchanges' holidays are not known, so their empty days are refetched."""
+
+    rules = [
+        Holiday('New Year', month=1, day=1, observance=sunday_to_monday),
+        USMartinLutherKingJr,
+        USPresidentsDay,
+        GoodFriday,
+        USMemorialDay,
+        Holiday('Juneteenth', month=6, day=19, start_date='2022-06-19', observance=nearest_workday),
+        Holiday('Independence Day', month=7, day=4, observance=nearest_workday),
+        USLaborDay,
+        USThanksgivingDay,
+        Holiday('Christmas', month=12, day=25, observance=nearest_workday),
+    ]
+
+
+_holidays = None
+
+
+def _exchange_holidays():
+    global _holidays
+    if _holidays is None:
+        days = ExchangeHolidayCalendar().holidays(SyntheticProvider.EPOCH, SyntheticProvider.HORIZON)
+        _holidays = days.to_numpy(dtype='datetime64[D]')
+    return _holidays
+
+
+def _expects_data(start, end):
+    # A span with no trading day in it (weekends, exchange holidays) may legitimately come back empty
+    return np.busday_count(start.date(), end.date(), holidays=_exchange_holidays()) > 0
+
+
+class MarketDataStore:
+    def __init__(self, provider=None, cache_dir=CACHE_DIR, memory_tickers=MEMORY_TICKERS):
+        self.provider = provider or provider_from_env()
+        self.cache_dir = cache_dir
+        self.memory_tickers = memory_tickers
+        self._memory = OrderedDict()
+        self._memory_guard = threading.Lock()
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+
+    def _lock(self, ticker):
+        with self._locks_guard:
+            return self._locks.setdefault(ticker, threading.Lock())
+
+    def _paths(self, ticker):
+        stem = os.path.join(self.cache_dir, ticker)
+        return f"{stem}.parquet", f"{stem}.json"
+
+    def _remember(self, ticker, entry):
+        with self._memory_guard:
+            self._memory[ticker] = entry
+            self._memory.move_to_end(ticker)
+            while len(self._memory) > self.memory_tickers:
+                self._memory.popitem(last=False)
+
+    def _read(self, ticker):
+        with self._memory_guard:
+            if ticker in self._memory:
+                self._memory.move_to_end(ticker)
+                return self._memory[ticker]
+        data_path, spans_path = self._paths(ticker)
+        if os.path.exists(data_path) and os.path.exists(spans_path):
+            frame = pd.read_parquet(data_path)
+            with open(spans_path) as f:
+                covered = [[pd.Timestamp(s), pd.Timestamp(e)] for s, e in json.load(f)]
+        else:
+            frame = pd.DataFrame(columns=COLUMNS, index=pd.DatetimeIndex([], name='Date'))
+            covered = []
+        self._remember(ticker, (frame, covered))
+        return frame, covered
+
+    def _write(self, ticker, frame, covered):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        data_path, spans_path = self._paths(ticker)
+        frame.to_parquet(f"{data_path}.tmp")
+        os.replace(f"{data_path}.tmp", data_path)
+        with open(f"{spans_path}.tmp", 'w') as f:
+            json.dump([[s.isoformat(), e.isoformat()] for s, e in covered], f)
+        os.replace(f"{spans_path}.tmp", spans_path)
+        self._remember(ticker, (frame, covered))
+
+    def history(self, ticker, start, end):
+        """Daily history for [start, end), fetching only spans not cached yet."""
+        ticker = check_ticker(ticker)
+        start, end = pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize()
+        with self._lock(ticker):
+            frame, covered = self._read(ticker)
+            missing = _missing_spans(covered, start, end)
+            if missing:
+                fetched = [_normalise(self.provider.history(ticker, s, e)) for s, e in missing]
+                frame = pd.concat([f for f in [frame, *fetched] if not f.empty] or [frame])
+                frame = frame[~frame.index.duplicated(keep='last')].sort_index()
+                # Days from today on may still change, so they are never marked as covered. Neither is
+                # an empty result for a span with trading days: the provider returns nothing on failure.
+                today = pd.Timestamp.today().normalize()
+                covered = _merge_spans(covered + [
+                    [s, min(e, today)] for (s, e), f in zip(missing, fetched)
+                    if s < today and not (f.empty and _expects_data(s, min(e, today)))
+                ])
+                self._write(ticker, frame, covered)
+        return frame[(frame.index >= start) & (frame.index < end)]
+
+
+def _history_with_retry(store, ticker, start, end, retries, backoff):
+    for attempt in range(retries + 1):
+        try:
+            return store.history(ticker, start, end)
+        except Exception:
+            if attempt == retries:
+                raise
+            # Exponential backoff with jitter so retries from many threads spread out
+            time.sleep(backoff * (2 ** attempt) * random.uniform(0.5, 1.5))
+
+
+def fetch_many(store, tickers, start, end, max_workers=16, retries=3, backoff=0.5, column='Close'):
+    """Fetch every ticker concurrently and return (wide frame of `column`, {ticker: error})."""
+    series, failures = {}, {}
+    valid = []
+    for ticker in dict.fromkeys(t.strip().upper() for t in tickers if t.strip()):
+        try:
+            valid.append(check_ticker(ticker))
+        except ValueError as e:
+            failures[ticker] = e  # Not worth retrying
+    tickers = valid
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tickers) or 1))) as pool:
+        futures = {t: pool.submit(_history_with_retry, store, t, start, end, retries, backoff) for t in tickers}
+        for ticker, future in futures.items():
+            try:
+                series[ticker] = future.result()[column]
+            except Exception as e:
+                failures[ticker] = e
+    wide = pd.concat(series, axis=1).sort_index() if series else pd.DataFrame()
+    return wide, failures
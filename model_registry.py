@@ -0,0 +1,261 @@
+"""Process-wide registry for the apps' model and scaler artifacts.
+
+Each app asks the registry for its bundle instead of unpickling files itself.
+A bundle is loaded once per process and keyed by the content hash of its
+files, so it is only reloaded when an artifact actually changes on disk.
+
+Numeric parameters (scaler statistics, OLS params, logistic coefficients) are
+extracted once into .npy files under .model_cache/<name>-<version>/ and
+opened with mmap_mode='r', so every worker process maps the same pages
+instead of holding its own copy. Feature names and class labels go in the
+cache's meta.json. Pickles are only unpickled when an app
+touches bundle.model or bundle.scaler.
+
+model_manifest.json records the expected sha256 of every artifact;
+check_artifacts() reports files that are missing or no longer match it.
+Update the manifest after retraining with:
+
+    python -m model_registry --update-manifest
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_DIR = os.environ.get('MODEL_ARTIFACT_DIR', '.')
+CACHE_DIR = os.path.join(ARTIFACT_DIR, '.model_cache')
+MANIFEST_PATH = os.path.join(ARTIFACT_DIR, 'model_manifest.json')
+# Bumped when the cache layout changes, so caches written by older code are rebuilt
+CACHE_FORMAT = 2
+
+ARTIFACTS = {
+    'admission': {'model': 'ols_model.pkl', 'scaler': 'scaler.pkl'},
+    'loantap': {'model': 'loantap_model.pkl', 'scaler': 'loantap_scaler.pkl'},
+    'ola': {'model': 'OLA_LGB_model.pkl', 'scaler': 'OLA_scaler.pkl'},
+}
+
+_lock = threading.RLock()
+_bundles = {}
+
+
+class ArtifactError(RuntimeError):
+    pass
+
+
+def _path(filename):
+    return os.path.join(ARTIFACT_DIR, filename)
+
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _signature(name):
+    stats = [os.stat(_path(f)) for f in ARTIFACTS[name].values()]
+    return tuple((s.st_size, s.st_mtime_ns) for s in stats)
+
+
+def _version(name):
+    digest = hashlib.sha256()
+    for filename in ARTIFACTS[name].values():
+        digest.update(_file_sha256(_path(filename)).encode())
+    return digest.hexdigest()[:16]
+
+
+def version(name):
+    """Content hash of name's artifact files as they are on disk now (a fresh bundle's version)."""
+    return _version(name)
+
+
+def _unpickle(filename):
+    with open(_path(filename), 'rb') as f:
+        return pickle.load(f)
+
+
+def _extract_arrays(model, scaler):
+    arrays = {}
+    if hasattr(scaler, 'mean_'):
+        arrays['scaler_mean'] = scaler.mean_
+        arrays['scaler_scale'] = scaler.scale_
+    if hasattr(model, 'params'):
+        arrays['params'] = np.asarray(model.params)
+    if hasattr(model, 'coef_'):
+        arrays['coef'] = model.coef_
+        arrays['intercept'] = model.intercept_
+    return {key: np.ascontiguousarray(value, dtype=np.float64) for key, value in arrays.items()}
+
+
+def _write_cache(name, version, model, scaler):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    target = os.path.join(CACHE_DIR, f"{name}-{version}")
+    staging = tempfile.mkdtemp(prefix=f".{name}-", dir=CACHE_DIR)
+    for key, value in _extract_arrays(model, scaler).items():
+        np.save(os.path.join(staging, f"{key}.npy"), value)
+    meta = {
+        'format': CACHE_FORMAT,
+        'name': name,
+        'version': version,
+        'feature_names': [str(c) for c in getattr(scaler, 'feature_names_in_', [])],
+        # Class labels of classifiers, so their order is known without unpickling the model
+        'classes': [c.item() if hasattr(c, 'item') else c for c in getattr(model, 'classes_', [])],
+    }
+    with open(os.path.join(staging, 'meta.json'), 'w') as f:
+        json.dump(meta, f, indent=2)
+    try:
+        os.rename(staging, target)
+    except OSError:
+        # Another worker published the same version first
+        shutil.rmtree(staging, ignore_errors=True)
+
+    # Drop caches of older versions of this artifact
+    for entry in os.listdir(CACHE_DIR):
+        if entry.startswith(f"{name}-") and entry != f"{name}-{version}":
+            shutil.rmtree(os.path.join(CACHE_DIR, entry), ignore_errors=True)
+    return target
+
+
+class ModelBundle:
+    def __init__(self, name, version, signature, cache_path, model=None, scaler=None):
+        self.name = name
+        self.version = version
+        self.signature = signature
+        self._model = model
+        self._scaler = scaler
+        with open(os.path.join(cache_path, 'meta.json')) as f:
+            meta = json.load(f)
+        self.feature_names = meta['feature_names']
+        self.classes = meta['classes']
+        self.arrays = {
+            entry[:-4]: np.load(os.path.join(cache_path, entry), mmap_mode='r')
+            for entry in sorted(os.listdir(cache_path)) if entry.endswith('.npy')
+        }
+
+    @property
+    def model(self):
+        with _lock:
+            if self._model is None:
+                self._model = _unpickle(ARTIFACTS[self.name]['model'])
+            return self._model
+
+    @property
+    def scaler(self):
+        with _lock:
+            if self._scaler is None:
+                self._scaler = _unpickle(ARTIFACTS[self.name]['scaler'])
+            return self._scaler
+
+
+def _cache_format(cache_path):
+    try:
+        with open(os.path.join(cache_path, 'meta.json')) as f:
+            return json.load(f).get('format')
+    except FileNotFoundError:
+        return None
+
+
+def _load(name, signature):
+    version = _version(name)
+    cache_path = os.path.join(CACHE_DIR, f"{name}-{version}")
+    model = scaler = None
+    if _cache_format(cache_path) != CACHE_FORMAT:
+        # Missing, or written by older code: rebuild it (workers already mapping the old files keep them)
+        shutil.rmtree(cache_path, ignore_errors=True)
+        model = _unpickle(ARTIFACTS[name]['model'])
+        scaler = _unpickle(ARTIFACTS[name]['scaler'])
+        cache_path = _write_cache(name, version, model, scaler)
+    logger.info("Loaded %s artifacts (version %s)", name, version)
+    return ModelBundle(name, version, signature, cache_path, model, scaler)
+
+
+def get(name):
+    if name not in ARTIFACTS:
+        raise KeyError(f"Unknown artifact bundle {name!r}")
+    with _lock:
+        try:
+            signature = _signature(name)
+        except FileNotFoundError as e:
+            raise ArtifactError(f"Missing artifact for {name}: {e.filename}") from e
+
+        bundle = _bundles.get(name)
+        if bundle is not None and bundle.signature == signature:
+            return bundle
+        if bundle is not None and bundle.version == _version(name):
+            # Touched but unchanged content: keep the loaded objects
+            bundle.signature = signature
+            return bundle
+
+        bundle = _load(name, signature)
+        _bundles[name] = bundle
+        return bundle
+
+
+def _read_manifest():
+    if not os.path.exists(MANIFEST_PATH):
+        return {}
+    with open(MANIFEST_PATH) as f:
+        return json.load(f)
+
+
+def check_artifacts(names=None):
+    """Return a list of (name, filename, problem) for missing or stale artifacts."""
+    manifest = _read_manifest()
+    problems = []
+    for name in names or ARTIFACTS:
+        for filename in ARTIFACTS[name].values():
+            path = _path(filename)
+            if not os.path.exists(path):
+                problems.append((name, filename, 'missing'))
+            elif filename not in manifest:
+                problems.append((name, filename, 'not in model_manifest.json'))
+            elif _file_sha256(path) != manifest[filename]:
+                problems.append((name, filename, 'stale: content differs from model_manifest.json'))
+    for name, filename, problem in problems:
+        logger.warning("Artifact %s (%s): %s", filename, name, problem)
+    return problems
+
+
+def update_manifest():
+    manifest = {}
+    for files in ARTIFACTS.values():
+        for filename in files.values():
+            if os.path.exists(_path(filename)):
+                manifest[filename] = _file_sha256(_path(filename))
+    with open(MANIFEST_PATH, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write('\n')
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check or update the model artifact manifest.')
+    parser.add_argument('--update-manifest', action='store_true', help='record the current artifact hashes')
+    args = parser.parse_args()
+
+    if args.update_manifest:
+        for filename, digest in update_manifest().items():
+            print(f"{digest}  {filename}")
+        return 0
+
+    problems = check_artifacts()
+    for name, filename, problem in problems:
+        print(f"{name:10} {filename:22} {problem}")
+    if not problems:
+        print("All artifacts present and up to date")
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,149 @@
+"""Bulk driver-attrition scoring for files shaped like ola__model_ready.csv.
+
+The input is streamed in chunks, so memory stays bounded by the chunk size
+(times the number of in-flight chunks when using worker processes). Each
+chunk is standardised with the OLA scaler statistics in one vectorised step
+and scored by LightGBM, either multi-threaded in this process (--threads) or
+spread over a process pool (--workers). Output is CSV or Parquet, chosen by
+the output file extension.
+
+    python ola_batch.py ola__model_ready.csv scored.parquet --threads 8
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import model_registry
+
+CHUNK_SIZE = 50_000
+PROBABILITY_COLUMN = 'churn_probability'
+
+
+class OlaScorer:
+    def __init__(self, bundle, num_threads=0):
+        self.model = bundle.model
+        self.feature_names = bundle.feature_names
+        self.mean = np.asarray(bundle.arrays['scaler_mean'])
+        self.scale = np.asarray(bundle.arrays['scaler_scale'])
+        self.churn_column = list(self.model.classes_).index(1)
+        self.num_threads = num_threads
+
+    def score(self, frame):
+        missing = [c for c in self.feature_names if c not in frame.columns]
+        if missing:
+            raise ValueError(f"Missing required columns: {', '.join(repr(c) for c in missing)}")
+        return self.score_matrix(frame[self.feature_names].to_numpy(dtype=np.float64))
+
+    def score_matrix(self, features):
+        # features: (n_rows, n_features) array in feature_names order
+        scaled = (features - self.mean) / self.scale
+        probabilities = self.model.predict_proba(scaled, num_threads=self.num_threads)
+        return probabilities[:, self.churn_column]
+
+
+class _Writer:
+    def __init__(self, path):
+        self.path = path
+        self.parquet = path.endswith('.parquet')
+        self._writer = None
+        self._schema = None
+        self._first = True
+
+    def write(self, frame):
+        if self.parquet:
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError as e:
+                raise RuntimeError("Parquet output requires pyarrow (pip install pyarrow)") from e
+            if self._writer is None:
+                # Every chunk is cast to the first chunk's schema: a later chunk whose int column turned
+                # float because of a NaN is written as nulls instead of failing the export part way.
+                # Columns with no values in the first chunk (type null) are widened to string.
+                schema = pa.Table.from_pandas(frame, preserve_index=False).schema
+                fields = [f.with_type(pa.string()) if pa.types.is_null(f.type) else f for f in schema]
+                self._schema = pa.schema(fields, metadata=schema.metadata)
+                self._writer = pq.ParquetWriter(self.path, self._schema)
+            self._writer.write_table(pa.Table.from_pandas(frame, schema=self._schema, preserve_index=False))
+        else:
+            frame.to_csv(self.path, mode='w' if self._first else 'a', header=self._first, index=False)
+        self._first = False
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+# Worker-process state, created once per worker by the pool initializer
+_worker_scorer = None
+
+
+def _init_worker(num_threads):
+    global _worker_scorer
+    _worker_scorer = OlaScorer(model_registry.get('ola'), num_threads)
+
+
+def _score_in_worker(frame):
+    frame[PROBABILITY_COLUMN] = _worker_scorer.score(frame)
+    return frame
+
+
+def _score_in_pool(chunks, workers, num_threads):
+    # Keep at most two chunks per worker in flight so memory stays bounded
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(num_threads,)) as pool:
+        pending = []
+        for chunk in chunks:
+            pending.append(pool.submit(_score_in_worker, chunk))
+            if len(pending) >= workers * 2:
+                yield pending.pop(0).result()
+        for future in pending:
+            yield future.result()
+
+
+def score_file(source, destination, chunk_size=CHUNK_SIZE, num_threads=0, workers=1):
+    """Score source into destination and return (rows, seconds)."""
+    start = time.perf_counter()
+    chunks = pd.read_csv(source, chunksize=chunk_size)
+    if workers > 1:
+        scored = _score_in_pool(chunks, workers, num_threads)
+    else:
+        scorer = OlaScorer(model_registry.get('ola'), num_threads)
+        scored = (chunk.assign(**{PROBABILITY_COLUMN: scorer.score(chunk)}) for chunk in chunks)
+
+    rows = 0
+    writer = _Writer(destination)
+    try:
+        for frame in scored:
+            writer.write(frame)
+            rows += len(frame)
+    finally:
+        writer.close()
+    return rows, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('source', help='input CSV shaped like ola__model_ready.csv')
+    parser.add_argument('destination', help='output .csv or .parquet file')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='rows per chunk')
+    parser.add_argument('--threads', type=int, default=0, help='LightGBM threads per scorer (0 = LightGBM default)')
+    parser.add_argument('--workers', type=int, default=1, help='scoring processes (1 = score in this process)')
+    args = parser.parse_args()
+
+    problems = model_registry.check_artifacts(['ola'])
+    if any(problem == 'missing' for _, _, problem in problems):
+        for _, filename, problem in problems:
+            print(f"{filename}: {problem}", file=sys.stderr)
+        return 1
+
+    rows, seconds = score_file(args.source, args.destination, args.chunk_size, args.threads, args.workers)
+    print(f"Scored {rows} rows in {seconds:.2f} s ({rows / seconds:,.0f} rows/s) -> {args.destination}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
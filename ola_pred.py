@@ -1,19 +1,55 @@
-# import streamlit as st
-# import pandas as pd
-import pickle
-# import numpy as np
-from PIL import Image
-import time
-import pickle
+import os
 import streamlit as st
-import pandas as pd
 import numpy as np
-import statsmodels.api as sm  # Import statsmodels to use sm.add_constant
+import model_registry
+from drift_monitor import get_monitor
+from latency import LatencyTracker
+from prediction_cache import PredictionCache
+from tracing import debug_sidebar, get_tracer
+
+
+# Per-stage timings, recorded only when APP_TRACING=1
+tracer = get_tracer('ola')
+
+
+# Report missing or stale artifacts once per process, before rendering anything
+@st.cache_resource
+def artifact_problems():
+    return model_registry.check_artifacts(['ola'])
+
+
+for name, filename, problem in artifact_problems():
+    st.warning(f"⚠️ Model artifact `{filename}`: {problem}")
+
 # Load assets
-with open('OLA_LGB_model.pkl', 'rb') as model_file:
-    model = pickle.load(model_file)
-with open('OLA_scaler.pkl', 'rb') as scaler_file:
-    scaler = pickle.load(scaler_file)
+try:
+    with tracer.span('artifact_load'):
+        bundle = model_registry.get('ola')
+        model = bundle.model
+except model_registry.ArtifactError as e:
+    st.error(f"⚠️ {e}")
+    st.stop()
+
+
+# Per-request latency budget, configurable with OLA_LATENCY_BUDGET_MS
+@st.cache_resource
+def load_latency_tracker():
+    return LatencyTracker(budget_ms=float(os.environ.get('OLA_LATENCY_BUDGET_MS', 100)))
+
+
+latency_tracker = load_latency_tracker()
+
+
+# Process-wide LRU of recent predictions; cleared when the model artifact changes
+@st.cache_resource
+def load_prediction_cache():
+    return PredictionCache(maxsize=4096)
+
+
+prediction_cache = load_prediction_cache()
+
+# Constant-memory histograms of submitted inputs, compared with the training data in drift_admin.py
+drift = get_monitor('ola')
 
 # Custom CSS for styling
 st.markdown("""
@@ -32,7 +68,7 @@ st.markdown("""
         font-size: 18px;
         color: #555;
     }
-    .stButton>button {
+    .stButton>button, .stFormSubmitButton>button {
         width: 100%;
         background-color: #4CAF50;
         color: white;
@@ -63,47 +99,83 @@ st.sidebar.write("**Algorithm:** LightGBM")
 st.sidebar.write("**Scaling:** StandardScaler")
 st.sidebar.write("**Prediction Output:** 1 - Churned, 0 - Active")
 
-# Input fields in columns
-col1, col2 = st.columns(2)
-
-with col1:
-    age = st.number_input('📅 Age', min_value=18, max_value=80, value=30, help='Enter the driver’s age')
-    gender = st.radio('⚤ Gender', ['Male', 'Female'], help='Select the driver’s gender')
-    education_level = st.selectbox('🎓 Education Level', [0, 1, 2], help='Encoded Education Levels: 0 - High School, 1 - Diploma, 2 - Graduate')
-    income = st.number_input('💰 Income ($)', min_value=1000, max_value=100000, value=10000, step=500, help='Monthly income in USD')
-    joining_designation = st.selectbox('🏅 Joining Designation', [1, 2, 3, 4, 5], help='Encoded: 1 - Trainee, 2 - Sub Junior Driver, 3 - Junior Driver, (4,5) - Senior Driver ')
-    tenure_months = st.number_input('📆 Tenure in Months', min_value=0, max_value=100, value=12, step=1, help='How long has the driver worked in months?')
-
-with col2:
-    quarterly_rating = st.slider('⭐ Quarterly Rating', min_value=1, max_value=4, value=3, step=1, help='Performance rating (1 - Poor, 4 - Excellent)')
-    total_business_value = st.number_input('💼 Total Business Value ($)', min_value=-1385530, max_value=95331060, value=5000, help='The total business value acquired by the driver in a month (negative business indicates cancellation/refund or car EMI adjustments)')
-    quarterly_rating_increase = st.radio('⚤ Quarterly Rating Increase', ['Yes', 'No'], help='Is there any increment in Quarterly rating')
-    income_increase = st.radio("⚤ Driver's Income Increase", ['Yes', 'No'], help="Is there any increment in Driver's Salary")
-    city_encoded = st.slider('🏙️ City Encoded', min_value=0.0, max_value=1.0, value=0.5, help='City impact factor that is to be decided by company')
-
-# Convert categorical inputs
-gender_encoded = 1 if gender == 'Male' else 0
-Quarterly_rating_increase_encoded = 1 if quarterly_rating_increase == 'Yes' else 0
-Income_increase_encoded = 1 if income_increase == 'Yes' else 0
-# Create input array
-input_data = np.array([[
-    age, gender_encoded, education_level, income, joining_designation,
-    quarterly_rating, tenure_months, total_business_value,
-    Quarterly_rating_increase_encoded, Income_increase_encoded, city_encoded
-]])
-
-# Scale input data
-input_scaled = scaler.transform(input_data)
+# Input fields in columns, inside a form so only submitting reruns the prediction path
+with st.form("driver_form"):
+    col1, col2 = st.columns(2)
+
+    with col1:
+        age = st.number_input('📅 Age', min_value=18, max_value=80, value=30, help='Enter the driver’s age')
+        gender = st.radio('⚤ Gender', ['Male', 'Female'], help='Select the driver’s gender')
+        education_level = st.selectbox('🎓 Education Level', [0, 1, 2], help='Encoded Education Levels: 0 - High School, 1 - Diploma, 2 - Graduate')
+        income = st.number_input('💰 Income ($)', min_value=1000, max_value=100000, value=10000, step=500, help='Monthly income in USD')
+        joining_designation = st.selectbox('🏅 Joining Designation', [1, 2, 3, 4, 5], help='Encoded: 1 - Trainee, 2 - Sub Junior Driver, 3 - Junior Driver, (4,5) - Senior Driver ')
+        tenure_months = st.number_input('📆 Tenure in Months', min_value=0, max_value=100, value=12, step=1, help='How long has the driver worked in months?')
+
+    with col2:
+        quarterly_rating = st.slider('⭐ Quarterly Rating', min_value=1, max_value=4, value=3, step=1, help='Performance rating (1 - Poor, 4 - Excellent)')
+        total_business_value = st.number_input('💼 Total Business Value ($)', min_value=-1385530, max_value=95331060, value=5000, help='The total business value acquired by the driver in a month (negative business indicates cancellation/refund or car EMI adjustments)')
+        quarterly_rating_increase = st.radio('⚤ Quarterly Rating Increase', ['Yes', 'No'], help='Is there any increment in Quarterly rating')
+        income_increase = st.radio("⚤ Driver's Income Increase", ['Yes', 'No'], help="Is there any increment in Driver's Salary")
+        city_encoded = st.slider('🏙️ City Encoded', min_value=0.0, max_value=1.0, value=0.5, help='City impact factor that is to be decided by company')
+
+    submitted = st.form_submit_button('🚀 Predict Attrition')
+
+
+# Scaling and prediction run only on submit; repeated inputs are served from prediction_cache
+def predict_attrition(features):
+    # Scale input data with the registry's scaler statistics
+    with tracer.span('scale'):
+        input_scaled = ((np.array(features, dtype=np.float64) - bundle.arrays['scaler_mean']) / bundle.arrays['scaler_scale']).reshape(1, -1)
+
+    # One ensemble pass: the class is the most probable column of predict_proba
+    with tracer.span('predict'):
+        probabilities = model.predict_proba(input_scaled)[0]
+    best = int(np.argmax(probabilities))
+    return model.classes_[best], probabilities[best]
+
 
 # Prediction button with loading effect
-if st.button('🚀 Predict Attrition'):
+if submitted:
+    # Convert categorical inputs
+    gender_encoded = 1 if gender == 'Male' else 0
+    Quarterly_rating_increase_encoded = 1 if quarterly_rating_increase == 'Yes' else 0
+    Income_increase_encoded = 1 if income_increase == 'Yes' else 0
+    # Create input tuple
+    input_data = (
+        age, gender_encoded, education_level, income, joining_designation,
+        quarterly_rating, tenure_months, total_business_value,
+        Quarterly_rating_increase_encoded, Income_increase_encoded, city_encoded
+    )
+
     with st.spinner('Running prediction...'):
-        time.sleep(2)  # Simulate delay
-        prediction = model.predict(input_scaled)[0]
-        confidence = model.predict_proba(input_scaled)[0][prediction]
+        with latency_tracker.measure() as timing:
+            prediction, confidence = prediction_cache.get_or_compute(
+                bundle.version, input_data, lambda: predict_attrition(input_data))
+        if drift is not None:
+            with tracer.span('drift_observe'):
+                drift.observe(input_data)
         result = '🚨 **Churned (Leaving)**' if prediction == 1 else '✅ **Active (Staying)**'
         st.success(f'### Prediction: {result}')
         st.info(f'**Confidence Level:** {confidence:.2%}')
+        if timing['over_budget']:
+            st.warning(f"⏱️ Prediction took {timing['elapsed_ms']:.1f} ms, over the {latency_tracker.budget_ms:.0f} ms budget")
+
+# Latency stats across all requests served by this process
+stats = latency_tracker.summary()
+st.sidebar.markdown("## Prediction Latency")
+if stats['count']:
+    st.sidebar.write(f"**p50:** {stats['p50_ms']:.2f} ms | **p99:** {stats['p99_ms']:.2f} ms")
+    st.sidebar.write(f"**Requests:** {stats['count']} | **Over budget:** {stats['over_budget']}")
+else:
+    st.sidebar.write("No predictions yet.")
+
+cache_stats = prediction_cache.stats()
+st.sidebar.markdown("## Prediction Cache")
+if cache_stats['hit_rate'] is not None:
+    st.sidebar.write(f"**Hit rate:** {cache_stats['hit_rate']:.1%} ({cache_stats['hits']} hits / {cache_stats['misses']} misses)")
+st.sidebar.write(f"**Entries:** {cache_stats['size']} / {cache_stats['maxsize']} | **Evictions:** {cache_stats['evictions']} | **Model changes:** {cache_stats['invalidations']}")
+
+debug_sidebar(tracer)
 
 # Footer
 st.markdown("---")
@@ -0,0 +1,87 @@
+"""Bounded, process-wide cache for single predictions.
+
+Entries are keyed on the normalised input tuple and tied to one model
+version: the first lookup with a different version (i.e. the artifact was
+replaced) clears the cache. Least recently used entries are evicted once
+maxsize is reached, and entries older than ttl_seconds (if set) are treated
+as misses.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+# Widget values such as 3.1 arrive as 3.1000000000000001 or 3.0999999999999996
+# depending on how the step was accumulated; rounding makes them one key
+KEY_DIGITS = 6
+
+
+def normalize_key(values, digits=KEY_DIGITS):
+    return tuple(round(float(v), digits) for v in values)
+
+
+class PredictionCache:
+    def __init__(self, maxsize=4096, ttl_seconds=None):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _lookup(self, version, key):
+        with self._lock:
+            if version != self.version:
+                if self.version is not None:
+                    self.invalidations += 1
+                self._entries.clear()
+                self.version = version
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, stored = entry
+                if self.ttl_seconds is None or time.monotonic() - stored < self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def _store(self, version, key, value):
+        with self._lock:
+            if version != self.version:
+                return
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, version, values, compute):
+        """Return the cached prediction for values, calling compute() on a miss."""
+        key = normalize_key(values)
+        found, value = self._lookup(version, key)
+        if found:
+            return value
+        value = compute()
+        self._store(version, key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'hit_rate': self.hits / lookups if lookups else None,
+            }
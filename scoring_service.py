@@ -0,0 +1,276 @@
+"""Headless HTTP scoring service for the admission, LoanTap and OLA models.
+
+Endpoints (JSON in, JSON out):
+
+    GET  /health                 loaded models and artifact problems
+    POST /predict/<model>        one record   -> one result
+    POST /batch/<model>          {"instances": [record, ...]} -> {"predictions": [...]}
+
+<model> is one of admission, loantap or ola. Records use the training column
+names (e.g. "GRE Score", "LOR ", "loan_amnt", "Total Business Value"); admission
+columns also match without their trailing space ("LOR").
+
+Each record is validated and encoded on the request thread; a null, NaN or
+infinite input is rejected with a 400 naming the field. Single-record
+requests are then handed to a MicroBatcher, which groups whatever arrives
+within a short window into one vectorised model call; batch requests are
+already vectorised and go straight to the model.
+
+    python scoring_service.py --port 8000 --batch-window-ms 2 --max-batch 128
+"""
+import argparse
+import json
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+import model_registry
+from admission_engine import AdmissionEngine
+from admission_schema import AdmissionSchema
+from loantap_compact import CompactLoanTapModel
+from loantap_features import LoanTapEncoder
+from loantap_schema import load_schema
+from ola_batch import OlaScorer
+
+logger = logging.getLogger(__name__)
+
+
+def check_finite(row, names):
+    """Raise ValueError naming the first field of row that is null (NaN after encoding), NaN or infinite."""
+    bad = np.flatnonzero(~np.isfinite(row))
+    if len(bad):
+        raise ValueError(f"field {names[bad[0]]!r} must be a finite number")
+    return row
+
+
+class AdmissionModel:
+    def __init__(self, bundle):
+        self.engine = AdmissionEngine.from_bundle(bundle)
+        self.schema = AdmissionSchema(self.engine.feature_names)
+
+    def prepare(self, record):
+        return check_finite(self.schema.row(record)[0], self.schema.feature_names)
+
+    def predict(self, rows):
+        return [{'chance': float(c)} for c in self.engine.predict(rows)]
+
+
+class LoanTapModel:
+    def __init__(self, bundle):
+        self.encoder = LoanTapEncoder(bundle.feature_names, load_schema()['options'])
+        # Scaler and logistic regression fused into one float32 weight vector
+        self.compact = CompactLoanTapModel.for_bundle(bundle, self.encoder)
+
+    def prepare(self, record):
+        return check_finite(self.encoder.encode_one(record), self.encoder.feature_columns)
+
+    def predict(self, rows):
+        z = self.compact.decision_dense(rows)
+        return [
+            {'approved': bool(d > 0), 'probability': float(p)}
+            for d, p in zip(z, self.compact.probability(z))
+        ]
+
+
+class OlaModel:
+    def __init__(self, bundle):
+        self.scorer = OlaScorer(bundle)
+
+    def prepare(self, record):
+        names = self.scorer.feature_names
+        return check_finite(np.array([record[name] for name in names], dtype=np.float64), names)
+
+    def predict(self, rows):
+        return [{'churn': bool(p > 0.5), 'probability': float(p)} for p in self.scorer.score_matrix(rows)]
+
+
+MODELS = {'admission': AdmissionModel, 'loantap': LoanTapModel, 'ola': OlaModel}
+
+
+def load_models(names=None):
+    """{name: model} for every requested model whose artifacts load; the rest are logged and skipped."""
+    models = {}
+    for name in names or MODELS:
+        try:
+            models[name] = MODELS[name](model_registry.get(name))
+        except (model_registry.ArtifactError, FileNotFoundError) as e:
+            logger.warning("Model %s unavailable: %s", name, e)
+    return models
+
+
+class MicroBatcher:
+    """Groups concurrent single-row requests into one model call.
+
+    The worker blocks for the first row, then keeps collecting until either
+    max_batch rows are queued or window_ms has passed since that first row.
+    """
+
+    def __init__(self, predict, max_batch=128, window_ms=2.0):
+        self.predict = predict
+        self.max_batch = max_batch
+        self.window = window_ms / 1000
+        self.batches = 0
+        self.rows = 0
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, row):
+        future = Future()
+        self._queue.put((row, future))
+        return future
+
+    def _run(self):
+        while True:
+            items = [self._queue.get()]
+            deadline = time.perf_counter() + self.window
+            while len(items) < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            rows = np.array([row for row, _ in items], dtype=np.float64)
+            try:
+                results = self.predict(rows)
+            except Exception as e:
+                for _, future in items:
+                    future.set_exception(e)
+                continue
+            self.batches += 1
+            self.rows += len(items)
+            for (_, future), result in zip(items, results):
+                future.set_result(result)
+
+
+class ScoringService:
+    def __init__(self, names=None, max_batch=128, window_ms=2.0, models=None):
+        # models: already loaded models (e.g. inherited from launcher.py) instead of loading them here
+        self.problems = model_registry.check_artifacts(names)
+        self.models = load_models(names) if models is None else dict(models)
+        self.batchers = {
+            name: MicroBatcher(model.predict, max_batch, window_ms) for name, model in self.models.items()
+        }
+
+    def predict_one(self, name, record):
+        row = self.models[name].prepare(record)
+        return self.batchers[name].submit(row).result()
+
+    def predict_many(self, name, records):
+        model = self.models[name]
+        rows = np.array([model.prepare(r) for r in records], dtype=np.float64)
+        return model.predict(rows) if len(rows) else []
+
+    def health(self):
+        return {
+            'models': sorted(self.models),
+            'problems': [{'model': n, 'file': f, 'problem': p} for n, f, p in self.problems],
+            'batches': {n: {'batches': b.batches, 'rows': b.rows} for n, b in self.batchers.items()},
+        }
+
+
+def make_handler(service):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        # Headers and body are written separately; without this Nagle adds ~40 ms per response
+        disable_nagle_algorithm = True
+
+        def _send(self, status, payload):
+            # NaN and Infinity are not JSON; inputs are checked finite, so they never reach a response
+            body = json.dumps(payload, allow_nan=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == '/health':
+                self._send(200, service.health())
+            else:
+                self._send(404, {'error': 'not found'})
+
+        def do_POST(self):
+            parts = self.path.strip('/').split('/')
+            if len(parts) != 2 or parts[0] not in ('predict', 'batch') or parts[1] not in MODELS:
+                self._send(404, {'error': 'not found'})
+                return
+            kind, name = parts
+            try:
+                length = int(self.headers.get('Content-Length', 0))
+                if length < 0:
+                    raise ValueError(length)
+            except ValueError:
+                self._send(400, {'error': 'invalid Content-Length'})
+                self.close_connection = True  # The body cannot be delimited
+                return
+            try:
+                payload = json.loads(self.rfile.read(length) or b'{}')
+            except ValueError as e:  # JSONDecodeError, or a body that is not UTF-8
+                self._send(400, {'error': f'invalid JSON: {e}'})
+                return
+            if name not in service.models:
+                self._send(503, {'error': f'model {name} is not loaded'})
+                return
+            try:
+                if kind == 'predict':
+                    self._send(200, service.predict_one(name, payload))
+                else:
+                    self._send(200, {'predictions': service.predict_many(name, payload['instances'])})
+            except KeyError as e:
+                self._send(400, {'error': f'missing field {e}'})
+            except (TypeError, ValueError) as e:
+                self._send(400, {'error': str(e)})
+            except Exception:
+                logger.exception("Scoring %s failed", name)
+                self._send(500, {'error': f'model {name} failed to score the request'})
+
+        def log_message(self, format, *args):
+            logger.debug(format, *args)
+
+    return Handler
+
+
+def make_server(service, host='127.0.0.1', port=8000, sock=None):
+    """HTTP server for service; sock is an already listening socket to share (see launcher.py) instead of binding."""
+    if sock is None:
+        server = ThreadingHTTPServer((host, port), make_handler(service))
+    else:
+        server = ThreadingHTTPServer(sock.getsockname()[:2], make_handler(service), bind_and_activate=False)
+        server.socket = sock
+        server.server_name, server.server_port = sock.getsockname()[:2]
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--max-batch', type=int, default=128, help='largest micro-batch per model call')
+    parser.add_argument('--batch-window-ms', type=float, default=2.0, help='how long a micro-batch waits to fill')
+    parser.add_argument('--models', nargs='+', choices=sorted(MODELS), help='models to serve (default: all)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+    service = ScoringService(args.models, args.max_batch, args.batch_window_ms)
+    server = make_server(service, args.host, args.port)
+    logger.info("Serving %s on http://%s:%d", ', '.join(sorted(service.models)) or 'no models', args.host, args.port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,16 +1,81 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
-import yfinance as yf
+from market_data import MarketDataStore, fetch_many
+from downsample import downsample, page, page_count
+from tracing import debug_sidebar, get_tracer
 
-# Download MSFT stock data
-msft = yf.Ticker("MSFT")
+# Per-stage timings, recorded only when APP_TRACING=1
+tracer = get_tracer('stock_market')
 
-# Get historical market data
-hist = msft.history(period="1d", start='2021-01-01', end='2023-12-31')
 
-# Display the dataframe as a table
-st.dataframe(hist)
+# One store per process; history is cached on disk and only missing dates are downloaded
+@st.cache_resource
+def load_market_store():
+    return MarketDataStore()
 
-# Display an area chart for the 'Close' price
-st.area_chart(hist['Close'])
+
+store = load_market_store()
+
+
+# Show long histories one page at a time so the table payload stays bounded
+def paged_dataframe(frame, key, page_size=500):
+    pages = page_count(frame, page_size)
+    page_number = st.number_input(f"Page (of {pages})", 1, pages, 1, key=key)
+    with tracer.span('page'):
+        rows = page(frame, page_number, page_size)
+    st.caption(f"Showing {len(rows)} of {len(frame)} rows")
+    st.dataframe(rows)
+
+
+# View selection
+mode = st.sidebar.radio("View", ["Single ticker", "Compare watchlist"])
+start = st.sidebar.date_input("Start date", pd.Timestamp('2021-01-01'), min_value=pd.Timestamp('1970-01-01'))
+end = st.sidebar.date_input("End date", pd.Timestamp('2023-12-31'), min_value=pd.Timestamp('1970-01-01'))
+# Charts never need more points than they have horizontal pixels
+chart_points = st.sidebar.slider("Chart resolution (points)", 200, 4000, 1000, step=100)
+
+if mode == "Single ticker":
+    ticker = st.sidebar.text_input("Ticker", "MSFT").strip().upper()
+
+    # Get historical market data
+    try:
+        with tracer.span('fetch'):
+            hist = store.history(ticker, start=start, end=end)
+    except ValueError as e:
+        st.error(f"⚠️ {e}")
+        st.stop()
+
+    # Display the dataframe as a table
+    paged_dataframe(hist, key="single_page")
+
+    # Display an area chart for the 'Close' price
+    with tracer.span('downsample'):
+        chart = downsample(hist['Close'], chart_points)
+    st.area_chart(chart)
+else:
+    watchlist = st.sidebar.text_area("Tickers (comma or newline separated)", "MSFT, AAPL, GOOGL, AMZN")
+    max_workers = st.sidebar.slider("Concurrent downloads", 1, 64, 16)
+    tickers = watchlist.replace(',', '\n').split('\n')
+
+    # Fetch every ticker concurrently and align the closes on one date index
+    with tracer.span('fetch_many'):
+        closes, failures = fetch_many(store, tickers, start, end, max_workers=max_workers)
+    if failures:
+        st.warning(f"⚠️ Could not fetch: {', '.join(sorted(failures))}")
+
+    if not closes.empty:
+        # Rebase each series to 100 at its first close so different price levels compare
+        rebased = closes / closes.bfill().iloc[0] * 100
+        st.subheader("Performance (rebased to 100)")
+        with tracer.span('downsample'):
+            chart = downsample(rebased, chart_points)
+        st.line_chart(chart)
+
+        st.subheader("Total return")
+        total_return = (closes.ffill().iloc[-1] / closes.bfill().iloc[0] - 1) * 100
+        st.bar_chart(total_return.rename("Return (%)"))
+
+        st.subheader("Daily close")
+        paged_dataframe(closes, key="watchlist_page")
+
+debug_sidebar(tracer)
@@ -0,0 +1,97 @@
+"""Benchmark and parity check: LoanTapEncoder vs. get_dummies + reindex.
+
+Random applications are drawn from the option vocabulary (including the
+reference levels that have no one-hot column). Exits non-zero if the two
+paths disagree. Run from the repo root:
+
+    python -m tools.bench_loantap_encoder --rows 10000
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+import model_registry
+from loantap_features import LoanTapEncoder, UnknownCategoryError
+from loantap_schema import TERM_OPTIONS
+from tools.synthetic_data import LOANTAP_GRADES, LOANTAP_PURPOSES, LOANTAP_VERIFICATION
+
+OPTIONS = {
+    'term': TERM_OPTIONS,
+    'purpose': LOANTAP_PURPOSES,
+    'verification_status': LOANTAP_VERIFICATION,
+    'grade': LOANTAP_GRADES,
+    'home_ownership': ['MORTGAGE', 'RENT', 'OWN', 'OTHER'],
+}
+
+
+def random_applications(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'loan_amnt': rng.integers(1, 101, rows) * 500,
+        'term': rng.choice(TERM_OPTIONS, rows),
+        'int_rate': rng.uniform(1.0, 30.0, rows).round(1),
+        'dti': rng.uniform(0.0, 50.0, rows).round(1),
+        'purpose': rng.choice(OPTIONS['purpose'], rows),
+        'verification_status': rng.choice(OPTIONS['verification_status'], rows),
+        'grade': rng.choice(OPTIONS['grade'], rows),
+        'annual_inc': rng.integers(10, 501, rows) * 1000,
+        'home_ownership': rng.choice(OPTIONS['home_ownership'], rows),
+        'Credit_History_Years': rng.integers(0, 51, rows),
+    })
+
+
+def legacy_encode(record, feature_columns):
+    # The path loantap_pred.py ran on every rerun
+    input_data = pd.get_dummies(pd.DataFrame({k: [v] for k, v in record.items()}))
+    return input_data.reindex(columns=feature_columns, fill_value=0)
+
+
+def per_call_us(fn, items):
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    return (time.perf_counter() - start) / len(items) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10_000)
+    args = parser.parse_args()
+
+    feature_columns = model_registry.get('loantap').feature_names
+    encoder = LoanTapEncoder(feature_columns, OPTIONS)
+    frame = random_applications(args.rows)
+    records = frame.to_dict('records')
+
+    legacy = np.vstack([legacy_encode(r, feature_columns).to_numpy(dtype=np.float64) for r in records])
+    single = np.vstack([encoder.encode_one(r) for r in records])
+    batch = encoder.encode(frame)
+    mismatches = int((np.abs(legacy - single).max(axis=1) > 0).sum() + (np.abs(legacy - batch).max(axis=1) > 0).sum())
+
+    try:
+        encoder.encode_one({**records[0], 'grade': 'Z'})
+        rejected = False
+    except UnknownCategoryError:
+        rejected = True
+
+    sample = records[:min(len(records), 2000)]
+    legacy_us = per_call_us(lambda r: legacy_encode(r, feature_columns), sample)
+    single_us = per_call_us(encoder.encode_one, sample)
+    start = time.perf_counter()
+    encoder.encode(frame)
+    batch_us = (time.perf_counter() - start) / len(frame) * 1e6
+
+    print(f"rows checked:                  {len(records)}")
+    print(f"mismatching rows:              {mismatches}")
+    print(f"unknown category rejected:     {rejected}")
+    print(f"get_dummies + reindex / row:   {legacy_us:9.1f} us")
+    print(f"encoder.encode_one / row:      {single_us:9.1f} us")
+    print(f"encoder.encode (batch) / row:  {batch_us:9.3f} us")
+    return 0 if mismatches == 0 and rejected else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""Cold-start and rerun timings for the LoanTap option/schema loading.
+
+Compares the old top-level dataset preprocessing (which ran on every rerun)
+with the cached sidecar path. Uses logistic_regression.csv when --csv points
+at it, otherwise a synthetic file of --rows rows. Run from the repo root:
+
+    python -m tools.bench_loantap_startup --rows 400000
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import pandas as pd
+
+from loantap_schema import load_schema
+from tools.synthetic_data import write_loantap_csv
+
+APP_FILES = [
+    'loantap_pred.py', 'loantap_model.pkl', 'loantap_scaler.pkl', 'loantap_schema.py', 'model_manifest.json',
+]
+
+
+def legacy_options(csv_path):
+    # Mirrors the module-level code loantap_pred.py ran on every rerun
+    df = pd.read_csv(csv_path)
+    df.loc[(df.home_ownership == 'ANY') | (df.home_ownership == 'NONE'), 'home_ownership'] = 'OTHER'
+    df['earliest_cr_line'] = pd.to_datetime(df['earliest_cr_line'], format='mixed')
+    df['issue_d'] = pd.to_datetime(df['issue_d'], format='mixed')
+    df['Credit_History_Years'] = (df['issue_d'] - df['earliest_cr_line']).dt.days / 365.25
+    return {field: df[field].unique().tolist() for field in ['purpose', 'verification_status', 'grade', 'home_ownership']}
+
+
+def timed(fn, *args, repeat=1):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def time_app_reruns(workdir, reruns):
+    from streamlit.testing.v1 import AppTest
+
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        at = AppTest.from_file(os.path.join(workdir, 'loantap_pred.py'), default_timeout=120)
+        cold = timed(at.run)
+        rerun = min(timed(at.run) for _ in range(reruns))
+    finally:
+        os.chdir(cwd)
+    return cold, rerun
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--csv', help='path to logistic_regression.csv (default: generate a synthetic file)')
+    parser.add_argument('--rows', type=int, default=400_000, help='rows in the synthetic dataset')
+    parser.add_argument('--reruns', type=int, default=5, help='app reruns to time')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        csv_path = os.path.join(workdir, 'logistic_regression.csv')
+        if args.csv:
+            shutil.copy(args.csv, csv_path)
+        else:
+            write_loantap_csv(csv_path, args.rows)
+        schema_path = os.path.join(workdir, 'loantap_schema.json')
+        rows = sum(1 for _ in open(csv_path)) - 1
+
+        legacy = timed(legacy_options, csv_path)
+        build = timed(load_schema, csv_path, schema_path)
+        sidecar = timed(load_schema, csv_path, schema_path, repeat=5)
+
+        for name in APP_FILES:
+            shutil.copy(name, workdir)
+        app_cold, app_rerun = time_app_reruns(workdir, args.reruns)
+
+    print(f"dataset rows:                          {rows}")
+    print(f"legacy preprocessing (every rerun):    {legacy * 1000:9.2f} ms")
+    print(f"sidecar build (first start only):      {build * 1000:9.2f} ms")
+    print(f"cold start with sidecar:               {sidecar * 1000:9.2f} ms")
+    print(f"app first run (AppTest):               {app_cold * 1000:9.2f} ms")
+    print(f"app rerun, schema cached (AppTest):    {app_rerun * 1000:9.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
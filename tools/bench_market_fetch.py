@@ -0,0 +1,48 @@
+"""Offline benchmark for concurrent watchlist fetching.
+
+Uses SyntheticProvider with simulated network latency and failures, so no
+network access is needed. Each run gets a fresh cache directory, so every
+ticker is really fetched. Run from the repo root:
+
+    python -m tools.bench_market_fetch --symbols 500 --latency 0.05
+"""
+import argparse
+import tempfile
+import time
+
+from market_data import MarketDataStore, SyntheticProvider, fetch_many
+
+
+def run(symbols, workers, latency, failure_rate, start, end):
+    tickers = [f"SYM{i:04d}" for i in range(symbols)]
+    provider = SyntheticProvider(latency=latency, failure_rate=failure_rate)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        store = MarketDataStore(provider, cache_dir)
+        began = time.perf_counter()
+        wide, failures = fetch_many(store, tickers, start, end, max_workers=workers, backoff=0.01)
+        cold = time.perf_counter() - began
+
+        began = time.perf_counter()
+        fetch_many(store, tickers, start, end, max_workers=workers)
+        warm = time.perf_counter() - began
+    return cold, warm, wide.shape, len(failures), len(provider.calls)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--symbols', type=int, default=500)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 16, 64])
+    parser.add_argument('--latency', type=float, default=0.05, help='simulated seconds per provider call')
+    parser.add_argument('--failure-rate', type=float, default=0.05, help='probability a provider call fails')
+    parser.add_argument('--start', default='2021-01-01')
+    parser.add_argument('--end', default='2023-12-31')
+    args = parser.parse_args()
+
+    print(f"{'workers':>8} {'cold (s)':>10} {'symbols/s':>10} {'warm (s)':>10} {'calls':>6} {'failed':>7}  shape")
+    for workers in args.workers:
+        cold, warm, shape, failed, calls = run(args.symbols, workers, args.latency, args.failure_rate, args.start, args.end)
+        print(f"{workers:>8} {cold:>10.2f} {args.symbols / cold:>10.0f} {warm:>10.3f} {calls:>6} {failed:>7}  {shape}")
+
+
+if __name__ == '__main__':
+    main()
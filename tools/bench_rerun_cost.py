@@ -0,0 +1,101 @@
+"""Rerun-cost benchmark for the form-based LoanTap and OLA apps.
+
+Before the forms, every widget change reran the whole script and rebuilt
+and scaled the feature row at top level. This times that per-rerun work on
+its own, then times AppTest reruns of the current apps: a rerun without
+submitting, the first submit of a new input, and a repeat submit served by
+the memoised scorer. Run from the repo root:
+
+    python -m tools.bench_rerun_cost --runs 20
+"""
+import argparse
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+import model_registry
+from loantap_schema import load_schema
+
+APPS = {'loantap': 'loantap_pred.py', 'ola': 'ola_pred.py'}
+
+
+def legacy_loantap(bundle, feature_columns):
+    # The top-level work loantap_pred.py did on every rerun
+    input_data = pd.DataFrame({
+        'loan_amnt': [500], 'term': [36], 'int_rate': [1.0], 'dti': [0.0], 'purpose': ['car'],
+        'verification_status': ['Verified'], 'grade': ['B'], 'annual_inc': [10000],
+        'home_ownership': ['RENT'], 'Credit_History_Years': [0],
+    })
+    input_data = pd.get_dummies(input_data).reindex(columns=feature_columns, fill_value=0)
+    return bundle.scaler.transform(input_data)
+
+
+def legacy_ola(bundle):
+    # The top-level work ola_pred.py did on every rerun
+    input_data = np.array([[30, 1, 0, 10000, 1, 3, 12, 5000, 1, 1, 0.5]])
+    return bundle.scaler.transform(input_data)
+
+
+def per_call_ms(fn, runs):
+    start = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - start) / runs * 1000
+
+
+def time_app(name, runs):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(f"../{APPS[name]}", default_timeout=60).run()
+    if at.exception or at.error:
+        return None
+    rerun_ms = per_call_ms(at.run, runs)
+
+    # Each first submit uses a fresh input so it misses the memoised scorer
+    first = []
+    for i in range(runs):
+        number = at.number_input[0]
+        number.set_value(number.min + (i + 1) * (number.step or 1))
+        start = time.perf_counter()
+        at.button[0].click().run()
+        first.append(time.perf_counter() - start)
+    repeat_ms = per_call_ms(lambda: at.button[0].click().run(), runs)
+    return rerun_ms, float(np.mean(first) * 1000), repeat_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+    warnings.filterwarnings('ignore')
+
+    legacy = {}
+    for name in APPS:
+        # One missing artifact skips that app, not the whole benchmark
+        try:
+            bundle = model_registry.get(name)
+            if name == 'loantap':
+                feature_columns = bundle.feature_names or load_schema()['feature_columns']
+                legacy[name] = per_call_ms(lambda: legacy_loantap(bundle, feature_columns), args.runs * 10)
+            else:
+                legacy[name] = per_call_ms(lambda: legacy_ola(bundle), args.runs * 10)
+        except (model_registry.ArtifactError, FileNotFoundError) as e:
+            print(f"{name}: skipped ({e})")
+
+    for name in legacy:
+        print(f"{name}:")
+        print(f"  old per-rerun feature build + scale: {legacy[name]:7.2f} ms (now skipped unless submitted)")
+        timings = time_app(name, args.runs)
+        if timings is None:
+            print("  app did not start (missing artifacts?)")
+            continue
+        rerun_ms, first_ms, repeat_ms = timings
+        print(f"  rerun without submit:                {rerun_ms:7.2f} ms")
+        print(f"  submit, new input:                   {first_ms:7.2f} ms")
+        print(f"  submit, repeated input (memoised):   {repeat_ms:7.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
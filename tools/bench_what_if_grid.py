@@ -0,0 +1,74 @@
+"""Benchmark and parity check for the admission what-if grid.
+
+Compares AdmissionEngine.predict_grid against scoring the same grid row by
+row with predict_one (the per-click path) and as one (n_points, n_features)
+matrix with predict, then times the heatmap render the app does. Exits
+non-zero if the paths disagree. Run from the repo root:
+
+    python -m tools.bench_what_if_grid --points 100000
+"""
+import argparse
+import io
+import sys
+import time
+
+import matplotlib
+
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+
+import model_registry
+from admission_engine import AdmissionEngine
+
+BASE = (320, 110, 4, 3.5, 3.5, 8.5, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--points', type=int, default=100_000)
+    args = parser.parse_args()
+
+    engine = AdmissionEngine.from_bundle(model_registry.get('admission'))
+    x_index, y_index = engine.feature_names.index('GRE Score'), engine.feature_names.index('CGPA')
+    side = int(np.ceil(np.sqrt(args.points)))
+    x_values, y_values = np.linspace(290, 340, side), np.linspace(6, 10, side)
+
+    start = time.perf_counter()
+    grid = engine.predict_grid(BASE, x_index, x_values, y_index, y_values)
+    grid_ms = (time.perf_counter() - start) * 1000
+
+    rows = np.tile(np.asarray(BASE, dtype=np.float64), (side * side, 1))
+    rows[:, x_index] = np.tile(x_values, side)
+    rows[:, y_index] = np.repeat(y_values, side)
+    start = time.perf_counter()
+    matrix = engine.predict(rows).reshape(side, side)
+    matrix_ms = (time.perf_counter() - start) * 1000
+
+    sample = rows[:min(len(rows), 5000)]
+    start = time.perf_counter()
+    loop = np.array([engine.predict_one(r) for r in sample])
+    loop_ms = (time.perf_counter() - start) / len(sample) * len(rows) * 1000
+
+    error = max(np.abs(grid - matrix).max(), np.abs(grid.ravel()[:len(sample)] - loop).max())
+
+    fig, ax = plt.subplots(figsize=(7, 5))
+    start = time.perf_counter()
+    image = ax.imshow(grid, origin='lower', aspect='auto', cmap='RdYlGn',
+                      extent=(x_values[0], x_values[-1], y_values[0], y_values[-1]))
+    fig.colorbar(image, ax=ax)
+    fig.savefig(io.BytesIO(), format='png')
+    render_ms = (time.perf_counter() - start) * 1000
+    plt.close(fig)
+
+    print(f"grid points:                     {side * side} ({side} x {side})")
+    print(f"max abs error vs predict:        {error:.2e} percentage points")
+    print(f"predict_one per point (extrap.): {loop_ms:9.1f} ms")
+    print(f"predict on full matrix:          {matrix_ms:9.2f} ms")
+    print(f"predict_grid (broadcast):        {grid_ms:9.2f} ms")
+    print(f"heatmap render to PNG:           {render_ms:9.1f} ms")
+    return 0 if error < 1e-9 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
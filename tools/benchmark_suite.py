@@ -0,0 +1,221 @@
+"""Benchmark suite for every app, written to a comparable JSON baseline.
+
+Each app is measured in a fresh Python process through streamlit.testing
+AppTest, so cold start includes imports and empty Streamlit caches:
+
+    cold_start_ms     first script run
+    artifact_load_ms  model_registry.get plus unpickling model and scaler
+    rerun_ms          median rerun with unchanged inputs
+    predict_ms        median rerun that predicts on a new input (a new ticker
+                      for stock_market.py)
+
+stock_market.py runs against the offline SyntheticProvider with a throwaway
+cache directory. Batch throughput is measured on ola__model_ready.csv and
+Jamboree_Admission.csv, tiled to --batch-rows rows. Run from the repo root:
+
+    python -m tools.benchmark_suite --output benchmark.json
+    python -m tools.benchmark_suite --compare benchmark.json --tolerance 0.25
+
+--compare exits non-zero when a timing is slower (or a throughput lower) than
+the baseline by more than --tolerance.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+APPS = {
+    'admission': 'Admission_pred.py',
+    'loantap': 'loantap_pred.py',
+    'ola': 'ola_pred.py',
+    'stock_market': 'stock_market.py',
+}
+# Metrics where a larger value is better; everything else is a timing
+THROUGHPUT_METRICS = {'rows_per_s'}
+
+
+def _median_ms(fn, runs):
+    samples = []
+    for i in range(runs):
+        start = time.perf_counter()
+        fn(i)
+        samples.append(time.perf_counter() - start)
+    return float(np.median(samples) * 1000)
+
+
+def measure_app(name, runs):
+    """Measure one app in this process; meant to run in a fresh interpreter."""
+    from streamlit.testing.v1 import AppTest
+
+    import model_registry
+
+    result = {}
+    start = time.perf_counter()
+    at = AppTest.from_file(os.path.abspath(APPS[name]), default_timeout=120).run()
+    result['cold_start_ms'] = (time.perf_counter() - start) * 1000
+    if at.exception or at.error:
+        return {'error': '; '.join(str(e.value) for e in [*at.exception, *at.error])}
+
+    if name == 'admission':
+        # The app loads the slim OLS export, not the registry pickles
+        import admission_artifact
+
+        admission_artifact._loaded.clear()
+        start = time.perf_counter()
+        admission_artifact.load()
+        result['artifact_load_ms'] = (time.perf_counter() - start) * 1000
+    elif name in model_registry.ARTIFACTS:
+        # Drop the in-process bundle so the load is timed from disk (the .model_cache arrays stay warm)
+        model_registry._bundles.pop(name, None)
+        start = time.perf_counter()
+        bundle = model_registry.get(name)
+        bundle.model, bundle.scaler
+        result['artifact_load_ms'] = (time.perf_counter() - start) * 1000
+
+    result['rerun_ms'] = _median_ms(lambda i: at.run(), runs)
+
+    if name == 'stock_market':
+        result['predict_ms'] = _median_ms(lambda i: at.text_input[0].set_value(f"BENCH{i}").run(), runs)
+    else:
+        # A new value for the first numeric input on every run, so no prediction cache can answer it.
+        # Elements are re-read after each run; stale handles do not carry new values.
+        def predict(i):
+            number = at.number_input[0]
+            number.set_value(number.min + (i + 1) * (number.step or 1))
+            at.button[0].click().run()
+
+        result['predict_ms'] = _median_ms(predict, runs)
+    return result
+
+
+def _tiled_csv(source, rows, directory):
+    frame = pd.read_csv(source)
+    tiled = pd.concat([frame] * max(1, -(-rows // len(frame))), ignore_index=True).iloc[:rows]
+    path = os.path.join(directory, os.path.basename(source))
+    tiled.to_csv(path, index=False)
+    return path, len(tiled)
+
+
+def measure_batch(rows):
+    import model_registry
+    from admission_batch import score_csv
+    from admission_engine import AdmissionEngine
+    from ola_batch import score_file
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path, n = _tiled_csv('Jamboree_Admission.csv', rows, directory)
+        engine = AdmissionEngine.from_bundle(model_registry.get('admission'))
+        start = time.perf_counter()
+        score_csv(path, engine).read()
+        results['admission'] = {'rows': n, 'rows_per_s': n / (time.perf_counter() - start)}
+
+        path, n = _tiled_csv('ola__model_ready.csv', rows, directory)
+        try:
+            n, seconds = score_file(path, os.path.join(directory, 'scored.csv'))
+            results['ola'] = {'rows': n, 'rows_per_s': n / seconds}
+        except model_registry.ArtifactError as e:
+            results['ola'] = {'error': str(e)}
+    return results
+
+
+def run_worker(name, runs, env):
+    # A fresh interpreter per app, so imports and Streamlit caches start cold
+    output = subprocess.run(
+        [sys.executable, '-m', 'tools.benchmark_suite', '--worker', name, '--runs', str(runs)],
+        capture_output=True, text=True, env=env,
+    )
+    if output.returncode != 0:
+        return {'error': output.stderr.strip().splitlines()[-1] if output.stderr.strip() else 'worker failed'}
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return None
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for section in ('apps', 'batch'):
+        for name, metrics in results[section].items():
+            for metric, value in metrics.items():
+                old = baseline.get(section, {}).get(name, {}).get(metric)
+                if not isinstance(value, (int, float)) or not isinstance(old, (int, float)) or metric == 'rows' or not old:
+                    continue
+                change = value / old - 1
+                worse = -change if metric in THROUGHPUT_METRICS else change
+                flag = 'REGRESSION' if worse > tolerance else ''
+                print(f"  {section}.{name}.{metric:<17} {old:12.2f} -> {value:12.2f} ({change:+7.1%}) {flag}")
+                if flag:
+                    regressions.append(f"{section}.{name}.{metric}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--apps', nargs='+', choices=sorted(APPS), default=list(APPS))
+    parser.add_argument('--runs', type=int, default=10, help='reruns per timed step')
+    parser.add_argument('--batch-rows', type=int, default=100_000)
+    parser.add_argument('--output', help='write results to this JSON file')
+    parser.add_argument('--compare', help='baseline JSON to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed relative slowdown before failing')
+    parser.add_argument('--worker', choices=sorted(APPS), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        warnings.filterwarnings('ignore')
+        print(json.dumps(measure_app(args.worker, args.runs)))
+        return 0
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = {**os.environ, 'MARKET_DATA_PROVIDER': 'synthetic', 'MARKET_DATA_CACHE_DIR': cache_dir}
+        apps = {}
+        for name in args.apps:
+            apps[name] = run_worker(name, args.runs, env)
+            print(f"{name}: {apps[name]}")
+
+    batch = measure_batch(args.batch_rows)
+    for name, metrics in batch.items():
+        print(f"batch {name}: {metrics}")
+
+    results = {
+        'meta': {
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'runs': args.runs,
+        },
+        'apps': apps,
+        'batch': batch,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print(f"Compared with {args.compare} (commit {baseline['meta'].get('commit')}):")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"FAIL: {len(regressions)} metric(s) regressed by more than {args.tolerance:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""Parity check: folded AdmissionEngine vs. the statsmodels predict path.
+
+Scores every row of Jamboree_Admission.csv both ways (batch and one row at a
+time) and exits non-zero if any prediction differs by more than TOLERANCE
+percentage points. The raw CSV is also scored through AdmissionSchema, in
+bulk with score_frame and row by row from records keyed by the stripped
+column names the app uses, to check the schema's column mapping. The engine
+built from the slim admission_ols.json export must predict exactly what the
+pickle-built engine does, and its 95% confidence intervals must match
+statsmodels' get_prediction. Run from the repository root:
+
+    python -m tools.check_admission_parity
+"""
+import pickle
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+import statsmodels.api as sm
+
+import admission_artifact
+from admission_batch import score_frame
+from admission_engine import AdmissionEngine
+from admission_schema import AdmissionSchema
+
+DATASET = 'Jamboree_Admission.csv'
+TOLERANCE = 1e-9
+
+
+def load_artifacts():
+    with open('ols_model.pkl', 'rb') as f:
+        sm_model = pickle.load(f)
+    with open('scaler.pkl', 'rb') as f:
+        scaler = pickle.load(f)
+    return sm_model, scaler
+
+
+def reference_predict(sm_model, scaler, features):
+    scaled = scaler.transform(features)
+    return sm_model.predict(sm.add_constant(scaled, has_constant='add')) * 100
+
+
+def reference_interval(sm_model, scaler, features, confidence=0.95):
+    scaled = sm.add_constant(scaler.transform(features), has_constant='add')
+    return sm_model.get_prediction(scaled).conf_int(alpha=1 - confidence) * 100
+
+
+def main():
+    warnings.filterwarnings('ignore')
+    sm_model, scaler = load_artifacts()
+    engine = AdmissionEngine.from_artifacts(sm_model, scaler)
+    dataset = pd.read_csv(DATASET)
+    features = dataset[engine.feature_names].to_numpy(dtype=np.float64)
+
+    expected = reference_predict(sm_model, scaler, features)
+    batch_error = np.max(np.abs(engine.predict(features) - expected))
+
+    start = time.perf_counter()
+    reference_rows = [reference_predict(sm_model, scaler, row.reshape(1, -1))[0] for row in features]
+    reference_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    engine_rows = [engine.predict_one(row) for row in features]
+    engine_time = time.perf_counter() - start
+
+    row_error = np.max(np.abs(np.array(engine_rows) - np.array(reference_rows)))
+
+    schema = AdmissionSchema(engine.feature_names)
+    bulk_error = np.max(np.abs(score_frame(dataset, engine) - expected))
+    records = dataset.rename(columns=str.strip).to_dict('records')
+    schema_rows = [engine.predict(schema.row(r))[0] for r in records]
+    schema_error = np.max(np.abs(np.array(schema_rows) - expected))
+    rmse = np.sqrt(np.mean((expected - schema.target(dataset)) ** 2))
+
+    slim = AdmissionEngine.from_artifact(admission_artifact.load())
+    slim_identical = np.array_equal(slim.predict(features), engine.predict(features))
+    low, high = slim.interval(features)
+    bounds = reference_interval(sm_model, scaler, features)
+    interval_error = max(np.max(np.abs(low - bounds[:, 0])), np.max(np.abs(high - bounds[:, 1])))
+
+    n = len(features)
+    print(f"rows checked:           {n}")
+    print(f"max batch abs error:    {batch_error:.3e}")
+    print(f"max per-row abs error:  {row_error:.3e}")
+    print(f"max schema bulk error:  {bulk_error:.3e}")
+    print(f"max schema row error:   {schema_error:.3e}")
+    print(f"RMSE vs Chance of Admit: {rmse:.2f} percentage points")
+    print(f"slim export identical:  {slim_identical}")
+    print(f"max 95% interval error: {interval_error:.3e}")
+    print(f"statsmodels per row:    {reference_time / n * 1e6:.1f} us")
+    print(f"engine per row:         {engine_time / n * 1e6:.1f} us")
+
+    if max(batch_error, row_error, bulk_error, schema_error, interval_error) > TOLERANCE:
+        print(f"FAIL: predictions differ by more than {TOLERANCE}")
+        return 1
+    if not slim_identical:
+        print("FAIL: the slim export predicts differently from the pickles")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
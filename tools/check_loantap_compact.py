@@ -0,0 +1,145 @@
+"""Parity check and throughput benchmark: CompactLoanTapModel vs. sklearn.
+
+Random applications are scored by the float32 compact model (record and
+dense paths) and by the sklearn path the app used (encode, scaler.transform,
+predict / predict_proba). The check fails if any approval probability
+differs by more than PROB_TOLERANCE, or any label differs outside the
+float32 rounding band around the 0.5 boundary, or a non-category column
+suffix (purpose_encoded -> 'encoded') is accepted as a category. When
+logistic_regression.csv is present, its rows (with Credit_History_Years
+derived as the app derives it) get the same probability and label checks,
+and Brier score and log loss against loan_status are compared to confirm
+the calibration is unchanged. Run from the repo root:
+
+    python -m tools.check_loantap_compact --rows 1000000
+"""
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+import model_registry
+from loantap_compact import CompactLoanTapModel
+from loantap_features import LoanTapEncoder, UnknownCategoryError
+from loantap_schema import DATASET
+from tools.bench_loantap_encoder import OPTIONS, random_applications
+
+PROB_TOLERANCE = 1e-5
+# Labels may flip only where float32 rounding can move z across 0
+BOUNDARY_BAND = 1e-4
+CALIBRATION_TOLERANCE = 1e-6
+
+
+def sklearn_scores(bundle, encoder, frame):
+    scaled = bundle.scaler.transform(pd.DataFrame(encoder.encode(frame), columns=bundle.feature_names))
+    return bundle.model.predict(scaled), bundle.model.predict_proba(scaled)[:, 1]
+
+
+def dataset_applications(path):
+    # Raw rows in the app's input format: term in months, credit history in years derived
+    # as the app and the training pipeline do (days between the two dates / 365.25)
+    data = pd.read_csv(path).dropna(subset=['loan_status'])
+    data = data[data['home_ownership'].isin(OPTIONS['home_ownership'])]
+    data['term'] = data['term'].str.extract(r'(\d+)', expand=False).astype(int)
+    issued = pd.to_datetime(data['issue_d'], format='mixed')
+    opened = pd.to_datetime(data['earliest_cr_line'], format='mixed')
+    data['Credit_History_Years'] = (issued - opened).dt.days / 365.25
+    return data.reset_index(drop=True)
+
+
+def calibration(probabilities, labels):
+    clipped = np.clip(probabilities.astype(np.float64), 1e-15, 1 - 1e-15)
+    brier = np.mean((clipped - labels) ** 2)
+    log_loss = -np.mean(labels * np.log(clipped) + (1 - labels) * np.log(1 - clipped))
+    return brier, log_loss
+
+
+def rows_per_second(fn, rows):
+    start = time.perf_counter()
+    fn()
+    return rows / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--parity-rows', type=int, default=200_000)
+    args = parser.parse_args()
+    warnings.filterwarnings('ignore')
+
+    bundle = model_registry.get('loantap')
+    encoder = LoanTapEncoder(bundle.feature_names, OPTIONS)
+    compact = CompactLoanTapModel.from_bundle(bundle, encoder)
+
+    frame = random_applications(args.parity_rows, seed=1)
+    labels, expected = sklearn_scores(bundle, encoder, frame)
+    record_prob = compact.predict_proba(frame)
+    dense_prob = compact.probability(compact.decision_dense(encoder.encode(frame)))
+    records = frame.head(2000).to_dict('records')
+    one_prob = np.array([compact.predict_one(r)[1] for r in records])
+
+    prob_error = max(
+        np.abs(record_prob - expected).max(), np.abs(dense_prob - expected).max(),
+        np.abs(one_prob - expected[:len(records)]).max(),
+    )
+    flipped = (record_prob > 0.5) != (labels == compact.positive_class)
+    outside_band = int((flipped & (np.abs(expected - 0.5) > BOUNDARY_BAND)).sum())
+    ok = prob_error <= PROB_TOLERANCE and outside_band == 0
+
+    # Label-encoded columns must not leak into the vocabulary as categories
+    leaked = []
+    for encode in (encoder.encode_one, compact.predict_one):
+        try:
+            encode(dict(records[0], purpose='encoded'))
+            leaked.append(encode.__qualname__)
+        except UnknownCategoryError:
+            pass
+    ok = ok and not leaked
+
+    print(f"applications checked:          {len(frame)}")
+    print(f"max probability abs error:     {prob_error:.2e} (tolerance {PROB_TOLERANCE:.0e})")
+    print(f"label flips (in / out of band): {int(flipped.sum()) - outside_band} / {outside_band}")
+    print(f"purpose 'encoded' accepted by: {', '.join(leaked) or 'none'}")
+
+    if os.path.exists(DATASET):
+        data = dataset_applications(DATASET)
+        observed = (data['loan_status'] == 'Fully Paid').to_numpy(dtype=np.float64)
+        data_labels, data_expected = sklearn_scores(bundle, encoder, data)
+        data_prob = compact.predict_proba(data)
+        reference = calibration(data_expected, observed)
+        fused = calibration(data_prob, observed)
+        drift = max(abs(a - b) for a, b in zip(reference, fused))
+        data_flipped = (data_prob > 0.5) != (data_labels == compact.positive_class)
+        data_outside = int((data_flipped & (np.abs(data_expected - 0.5) > BOUNDARY_BAND)).sum())
+        data_error = np.abs(data_prob - data_expected).max()
+        ok = ok and drift <= CALIBRATION_TOLERANCE and data_error <= PROB_TOLERANCE and data_outside == 0
+        print(f"{DATASET} rows:     {len(data)}")
+        print(f"dataset max probability error: {data_error:.2e}")
+        print(f"dataset label flips (in/out):  {int(data_flipped.sum()) - data_outside} / {data_outside}")
+        print(f"Brier sklearn / compact:       {reference[0]:.6f} / {fused[0]:.6f}")
+        print(f"log loss sklearn / compact:    {reference[1]:.6f} / {fused[1]:.6f}")
+
+    big = random_applications(args.rows, seed=2)
+    encoded = encoder.encode(big)
+    sklearn_rate = rows_per_second(lambda: sklearn_scores(bundle, encoder, big), len(big))
+    record_rate = rows_per_second(lambda: compact.predict_proba(big), len(big))
+    dense_rate = rows_per_second(lambda: compact.probability(compact.decision_dense(encoded)), len(big))
+    sample = big.head(20_000).to_dict('records')
+    sklearn_one = rows_per_second(lambda: [sklearn_scores(bundle, encoder, frame.iloc[[i]]) for i in range(200)], 200)
+    one_rate = rows_per_second(lambda: [compact.predict_one(r) for r in sample], len(sample))
+
+    print(f"sklearn path (batch):          {sklearn_rate * 60 / 1e6:8.1f} M applications/min")
+    print(f"compact, raw records (batch):  {record_rate * 60 / 1e6:8.1f} M applications/min")
+    print(f"compact, encoded rows (batch): {dense_rate * 60 / 1e6:8.1f} M applications/min")
+    print(f"sklearn path, one at a time:   {sklearn_one * 60 / 1e6:8.3f} M applications/min")
+    print(f"compact predict_one:           {one_rate * 60 / 1e6:8.1f} M applications/min")
+    print("OK" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""Import-time report for each app, based on python -X importtime.
+
+Each app gets one cold run through streamlit.testing AppTest in a fresh
+interpreter started with -X importtime. Imports already made by the harness
+itself (streamlit and AppTest) are measured separately and subtracted, so
+the report shows only what the app's first script run pulls in: the total
+import time and the most expensive top-level packages. Run from the repo
+root:
+
+    python -m tools.import_time_report
+    python -m tools.import_time_report --output imports.json --compare before.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+APPS = {
+    'admission': 'Admission_pred.py',
+    'loantap': 'loantap_pred.py',
+    'ola': 'ola_pred.py',
+    'stock_market': 'stock_market.py',
+}
+HARNESS = (
+    "import warnings; warnings.filterwarnings('ignore')\n"
+    "from streamlit.testing.v1 import AppTest\n"
+)
+RUN_APP = "AppTest.from_file({path!r}, default_timeout=120).run()\n"
+
+
+def import_times(code, env):
+    """{top-level package: cumulative microseconds} for every first import made by code."""
+    output = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True, env=env,
+    )
+    packages = defaultdict(int)
+    for line in output.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        # Only outermost imports (one leading space); nested ones are inside their parent's cumulative time
+        if len(name) - len(name.lstrip()) > 1:
+            continue
+        packages[name.strip().split('.')[0]] += int(cumulative)
+    return dict(packages)
+
+
+def app_report(name, env, top):
+    baseline = import_times(HARNESS, env)
+    run = import_times(HARNESS + RUN_APP.format(path=os.path.abspath(APPS[name])), env)
+    added = {pkg: us for pkg, us in run.items() if pkg not in baseline}
+    ranked = sorted(added.items(), key=lambda item: item[1], reverse=True)
+    return {
+        'total_ms': sum(added.values()) / 1000,
+        'top': {pkg: us / 1000 for pkg, us in ranked[:top]},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--apps', nargs='+', choices=sorted(APPS), default=list(APPS))
+    parser.add_argument('--top', type=int, default=8, help='packages listed per app')
+    parser.add_argument('--output', help='write the report to this JSON file')
+    parser.add_argument('--compare', help='earlier report JSON to compare totals against')
+    args = parser.parse_args()
+
+    env = {**os.environ, 'MARKET_DATA_PROVIDER': 'synthetic'}
+    report = {}
+    for name in args.apps:
+        report[name] = app_report(name, env, args.top)
+        print(f"{name}: {report[name]['total_ms']:.0f} ms of imports on first run")
+        for pkg, ms in report[name]['top'].items():
+            print(f"    {pkg:<24} {ms:8.1f} ms")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            before = json.load(f)
+        print(f"Compared with {args.compare}:")
+        for name, entry in report.items():
+            if name in before:
+                old = before[name]['total_ms']
+                print(f"    {name:<14} {old:8.0f} ms -> {entry['total_ms']:8.0f} ms ({entry['total_ms'] / old - 1:+.0%})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
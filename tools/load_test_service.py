@@ -0,0 +1,145 @@
+"""Load test for scoring_service.py, compared with the Streamlit rerun path.
+
+Starts the service in-process on a free port (or targets --url), fires
+single-record requests from --concurrency keep-alive clients, then measures
+the /batch endpoint, and finally times full AppTest reruns of the matching
+Streamlit app (one script run per prediction). Run from the repo root:
+
+    python -m tools.load_test_service --model admission --requests 5000 --concurrency 32
+"""
+import argparse
+import http.client
+import json
+import socket
+import threading
+import time
+from urllib.parse import urlparse
+
+import numpy as np
+import pandas as pd
+
+from loantap_schema import load_schema
+from scoring_service import ScoringService, make_server
+
+APPS = {'admission': 'Admission_pred.py', 'loantap': 'loantap_pred.py', 'ola': 'ola_pred.py'}
+
+
+def sample_records(model, n, seed=0):
+    rng = np.random.default_rng(seed)
+    if model == 'admission':
+        frame = pd.read_csv('Jamboree_Admission.csv').drop(columns=['Serial No.', 'Chance of Admit '])
+    elif model == 'ola':
+        frame = pd.read_csv('ola__model_ready.csv').drop(columns=['Target_Var'])
+    else:
+        options = load_schema()['options']
+        frame = pd.DataFrame({
+            'loan_amnt': rng.integers(1, 101, n) * 500,
+            'term': rng.choice(options['term'], n),
+            'int_rate': rng.uniform(1.0, 30.0, n).round(1),
+            'dti': rng.uniform(0.0, 50.0, n).round(1),
+            'purpose': rng.choice(options['purpose'], n),
+            'verification_status': rng.choice(options['verification_status'], n),
+            'grade': rng.choice(options['grade'], n),
+            'annual_inc': rng.integers(10, 501, n) * 1000,
+            'home_ownership': rng.choice(options['home_ownership'], n),
+            'Credit_History_Years': rng.integers(0, 51, n),
+        })
+    records = json.loads(frame.to_json(orient='records'))
+    return [records[i] for i in rng.integers(0, len(records), n)]
+
+
+def post(conn, path, payload):
+    body = json.dumps(payload)
+    conn.request('POST', path, body, {'Content-Type': 'application/json'})
+    response = conn.getresponse()
+    data = response.read()
+    if response.status != 200:
+        raise RuntimeError(f"{path} -> {response.status}: {data[:200]!r}")
+    return json.loads(data)
+
+
+def run_clients(host, port, path, payloads, concurrency):
+    latencies = []
+    lock = threading.Lock()
+    chunks = [payloads[i::concurrency] for i in range(concurrency)]
+
+    def client(chunk):
+        conn = http.client.HTTPConnection(host, port)
+        conn.connect()
+        conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        local = []
+        for payload in chunk:
+            start = time.perf_counter()
+            post(conn, path, payload)
+            local.append(time.perf_counter() - start)
+        conn.close()
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=client, args=(chunk,)) for chunk in chunks]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    return elapsed, np.array(latencies) * 1000
+
+
+def time_streamlit(model, runs):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(f"../{APPS[model]}", default_timeout=60).run()
+    if at.exception or at.error:
+        return None
+    start = time.perf_counter()
+    for _ in range(runs):
+        at.button[0].click().run()
+    return (time.perf_counter() - start) / runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--model', choices=sorted(APPS), default='admission')
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--batch-size', type=int, default=256, help='records per /batch request')
+    parser.add_argument('--batch-window-ms', type=float, default=2.0)
+    parser.add_argument('--streamlit-runs', type=int, default=20)
+    parser.add_argument('--url', help='target a running service instead of starting one')
+    args = parser.parse_args()
+
+    if args.url:
+        target = urlparse(args.url)
+        host, port, server = target.hostname, target.port, None
+    else:
+        service = ScoringService([args.model], window_ms=args.batch_window_ms)
+        server = make_server(service, port=0)
+        host, port = server.server_address
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    records = sample_records(args.model, args.requests)
+    elapsed, latencies = run_clients(host, port, f"/predict/{args.model}", records, args.concurrency)
+    p50, p99 = np.percentile(latencies, [50, 99])
+    print(f"single  : {len(records) / elapsed:9.0f} req/s  p50 {p50:6.2f} ms  p99 {p99:6.2f} ms "
+          f"({args.concurrency} clients)")
+    if server is not None:
+        stats = service.batchers[args.model]
+        print(f"          {stats.rows / max(stats.batches, 1):.1f} rows per micro-batch on average")
+
+    batches = [{'instances': records[i:i + args.batch_size]} for i in range(0, len(records), args.batch_size)]
+    elapsed, _ = run_clients(host, port, f"/batch/{args.model}", batches, min(args.concurrency, len(batches)))
+    print(f"batch   : {len(records) / elapsed:9.0f} rows/s ({args.batch_size} records per request)")
+
+    per_run = time_streamlit(args.model, args.streamlit_runs)
+    if per_run is None:
+        print("streamlit: app did not start (missing artifacts?)")
+    else:
+        print(f"streamlit: {1 / per_run:8.1f} predictions/s ({per_run * 1000:.1f} ms per script rerun)")
+
+    if server is not None:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
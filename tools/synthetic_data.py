@@ -0,0 +1,59 @@
+"""Synthetic stand-ins for datasets that are not checked into the repo.
+
+logistic_regression.csv (the LoanTap training data) is not versioned, so the
+benchmarks generate a file with the same columns and value formats instead.
+"""
+import numpy as np
+import pandas as pd
+
+LOANTAP_PURPOSES = [
+    'debt_consolidation', 'credit_card', 'home_improvement', 'other', 'major_purchase',
+    'small_business', 'car', 'medical', 'moving', 'vacation', 'house', 'wedding',
+    'renewable_energy', 'educational',
+]
+LOANTAP_HOME_OWNERSHIP = ['MORTGAGE', 'RENT', 'OWN', 'OTHER', 'NONE', 'ANY']
+LOANTAP_VERIFICATION = ['Not Verified', 'Source Verified', 'Verified']
+LOANTAP_GRADES = list('ABCDEFG')
+
+
+def _month_strings(rng, n, first_year, last_year):
+    months = np.array(['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])
+    years = rng.integers(first_year, last_year + 1, n).astype(str)
+    return np.char.add(np.char.add(months[rng.integers(0, 12, n)], '-'), years)
+
+
+def loantap_frame(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    grade = rng.choice(LOANTAP_GRADES, rows, p=[0.16, 0.29, 0.27, 0.16, 0.08, 0.03, 0.01])
+    return pd.DataFrame({
+        'loan_amnt': rng.integers(1, 81, rows) * 500,
+        'term': rng.choice([' 36 months', ' 60 months'], rows, p=[0.76, 0.24]),
+        'int_rate': rng.uniform(5.3, 31.0, rows).round(2),
+        'installment': rng.uniform(16.0, 1500.0, rows).round(2),
+        'grade': grade,
+        'sub_grade': np.char.add(grade.astype(str), rng.integers(1, 6, rows).astype(str)),
+        'emp_length': rng.choice(['< 1 year', '1 year', '5 years', '10+ years'], rows),
+        'home_ownership': rng.choice(LOANTAP_HOME_OWNERSHIP, rows, p=[0.5, 0.4, 0.0948, 0.0048, 0.0003, 0.0001]),
+        'annual_inc': rng.lognormal(11.0, 0.5, rows).round(0),
+        'verification_status': rng.choice(LOANTAP_VERIFICATION, rows),
+        'issue_d': _month_strings(rng, rows, 2007, 2016),
+        'loan_status': rng.choice(['Fully Paid', 'Charged Off'], rows, p=[0.8, 0.2]),
+        'purpose': rng.choice(LOANTAP_PURPOSES, rows),
+        'dti': rng.uniform(0.0, 40.0, rows).round(2),
+        'earliest_cr_line': _month_strings(rng, rows, 1960, 2005),
+        'open_acc': rng.integers(1, 40, rows),
+        'pub_rec': rng.poisson(0.2, rows),
+        'revol_bal': rng.integers(0, 60000, rows),
+        'revol_util': rng.uniform(0.0, 100.0, rows).round(1),
+        'total_acc': rng.integers(2, 80, rows),
+        'initial_list_status': rng.choice(['f', 'w'], rows),
+        'application_type': rng.choice(['INDIVIDUAL', 'JOINT', 'DIRECT_PAY'], rows, p=[0.998, 0.001, 0.001]),
+        'mort_acc': rng.poisson(1.7, rows),
+        'pub_rec_bankruptcies': rng.poisson(0.12, rows),
+        'address': np.char.add('1 Main St, Anytown, ZZ ', rng.choice(['05113', '11650', '22690', '29597'], rows)),
+    })
+
+
+def write_loantap_csv(path, rows, seed=0):
+    loantap_frame(rows, seed).to_csv(path, index=False)
+    return path
@@ -0,0 +1,171 @@
+"""Per-stage timing and memory tracing for the apps' hot paths.
+
+Wrap each stage of a request in a span:
+
+    tracer = get_tracer('loantap')
+    with tracer.span('encode'):
+        row = encoder.encode_one(record)
+
+Every span records its wall time and the change in resident memory into a
+rolling per-stage window kept in this process (the memory change is 0
+where RSS cannot be read, e.g. on Windows). Tracing is off unless
+APP_TRACING=1; a disabled tracer hands out one shared no-op context manager,
+so instrumented code pays only an attribute lookup and a method call.
+
+summary() feeds the debug sidebar (debug_sidebar) and prometheus_text()
+renders every tracer in the Prometheus text exposition format.
+"""
+import contextlib
+import os
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+
+import numpy as np
+
+ENABLED = os.environ.get('APP_TRACING', '0').lower() in ('1', 'true', 'yes', 'on')
+
+_NULL_SPAN = contextlib.nullcontext()
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def _rss_bytes():
+    # Current RSS on Linux; elsewhere fall back to the peak, which only ever grows; None where neither exists
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None  # Windows
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class _Stage:
+    def __init__(self, window):
+        self.durations_ms = deque(maxlen=window)
+        self.memory_deltas = deque(maxlen=window)
+        self.count = 0
+        self.total_seconds = 0.0
+
+
+class Tracer:
+    def __init__(self, app, enabled=ENABLED, window=500):
+        self.app = app
+        self.enabled = enabled
+        self.window = window
+        self._stages = defaultdict(lambda: _Stage(window))
+        self._lock = threading.Lock()
+
+    def span(self, stage):
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._span(stage)
+
+    @contextlib.contextmanager
+    def _span(self, stage):
+        rss = _rss_bytes()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            after = _rss_bytes()
+            self.record(stage, elapsed, 0 if rss is None or after is None else after - rss)
+
+    def record(self, stage, seconds, memory_delta=0):
+        with self._lock:
+            entry = self._stages[stage]
+            entry.durations_ms.append(seconds * 1000)
+            entry.memory_deltas.append(memory_delta)
+            entry.count += 1
+            entry.total_seconds += seconds
+
+    def summary(self):
+        """{stage: {count, last_ms, p50_ms, p99_ms, mean_memory_kb}} over the rolling window."""
+        with self._lock:
+            stages = {
+                name: (np.array(s.durations_ms), np.array(s.memory_deltas), s.count)
+                for name, s in self._stages.items()
+            }
+        summary = {}
+        for name, (durations, deltas, count) in stages.items():
+            p50, p99 = np.percentile(durations, [50, 99])
+            summary[name] = {
+                'count': count,
+                'last_ms': float(durations[-1]),
+                'p50_ms': float(p50),
+                'p99_ms': float(p99),
+                'mean_memory_kb': float(deltas.mean() / 1024),
+            }
+        return summary
+
+    def _prometheus_samples(self):
+        with self._lock:
+            stages = {
+                name: (np.array(s.durations_ms) / 1000, np.array(s.memory_deltas), s.count, s.total_seconds)
+                for name, s in self._stages.items()
+            }
+        for name, (durations, deltas, count, total) in stages.items():
+            labels = f'app="{self.app}",stage="{name}"'
+            for q in (0.5, 0.9, 0.99):
+                yield 'app_stage_duration_seconds', f'{{{labels},quantile="{q}"}}', float(np.quantile(durations, q))
+            yield 'app_stage_duration_seconds_sum', f'{{{labels}}}', total
+            yield 'app_stage_duration_seconds_count', f'{{{labels}}}', count
+            yield 'app_stage_memory_delta_bytes', f'{{{labels}}}', float(deltas.mean())
+
+
+_tracers = {}
+_tracers_lock = threading.Lock()
+
+
+def get_tracer(app):
+    """The process-wide tracer for app, created on first use."""
+    with _tracers_lock:
+        if app not in _tracers:
+            _tracers[app] = Tracer(app)
+        return _tracers[app]
+
+
+def prometheus_text():
+    """Every tracer's stages in the Prometheus text exposition format."""
+    with _tracers_lock:
+        tracers = list(_tracers.values())
+    lines = [
+        '# HELP app_stage_duration_seconds Wall time per traced stage over the rolling window.',
+        '# TYPE app_stage_duration_seconds summary',
+    ]
+    gauges = []
+    for tracer in tracers:
+        for metric, labels, value in tracer._prometheus_samples():
+            line = f'{metric}{labels} {value:.9g}'
+            (gauges if metric == 'app_stage_memory_delta_bytes' else lines).append(line)
+    lines += [
+        '# HELP app_stage_memory_delta_bytes Mean change in resident memory per traced stage.',
+        '# TYPE app_stage_memory_delta_bytes gauge',
+        *gauges,
+    ]
+    return '\n'.join(lines) + '\n'
+
+
+def debug_sidebar(tracer):
+    """Stage timings and the Prometheus export in the Streamlit sidebar; nothing when tracing is off."""
+    if not tracer.enabled:
+        return
+    import pandas as pd
+    import streamlit as st
+
+    st.sidebar.markdown("## 🐞 Debug: Stage Timings")
+    summary = tracer.summary()
+    if not summary:
+        st.sidebar.write("No traced stages yet.")
+        return
+    st.sidebar.dataframe(pd.DataFrame.from_dict(summary, orient='index').round(3))
+    with st.sidebar.expander("Prometheus export"):
+        text = prometheus_text()
+        st.code(text, language='text')
+        st.download_button("⬇️ Download metrics", text, file_name="metrics.prom", mime="text/plain")